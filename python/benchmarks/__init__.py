@@ -0,0 +1,10 @@
+"""
+Performance benchmarks for littlebit. Run them from the python/ directory:
+
+    python -m benchmarks                   microbenchmarks of every primitive
+    python -m benchmarks.field_arithmetic  specialized vs generic arithmetic mod P
+    python -m benchmarks.verify_batch      verify_batch throughput by batch size
+    python -m benchmarks.timing_variance   cost of the constant-time ladder
+    python -m benchmarks.parallel          scaling with worker processes
+    python -m benchmarks.async_latency     event loop latency of the async front-end
+"""
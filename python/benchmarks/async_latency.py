@@ -0,0 +1,87 @@
+"""
+Event loop latency while verifying signatures from coroutines: direct calls to
+S256Point.verify compared to the AsyncVerifier micro-batching front-end.
+
+A probe coroutine sleeps for 1ms in a loop, and records how late it wakes up. With
+direct calls, the probe is stuck behind every verification.
+
+Usage (from the python/ directory):
+    python -m benchmarks.async_latency [--requests 200] [--executor thread|process]
+"""
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from littlebit.cryptography.secp256k1.aio import AsyncVerifier
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+async def probe(lags, stop):
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(0.001)
+        lags.append((time.perf_counter() - start - 0.001) * 1000)
+
+
+async def run(items, verify):
+    lags, stop = [], asyncio.Event()
+    task = asyncio.ensure_future(probe(lags, stop))
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(verify(*item) for item in items))
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    await task
+    assert all(results)
+    return elapsed, lags
+
+
+def report(name, count, elapsed, lags):
+    lags = sorted(lags) or [0.0]
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{name:<16} {count / elapsed:>10.1f} verify/s   loop lag: "
+        f"median {statistics.median(lags):>7.2f} ms, p99 {p99:>7.2f} ms, "
+        f"max {lags[-1]:>7.2f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--batch-size", type=int, default=32)
+    parser.add_argument("--executor", choices=("thread", "process"), default="thread")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    keys = [PrivateKey(rng.randrange(1, N)) for _ in range(8)]
+    items = []
+    for i in range(args.requests):
+        z = rng.randrange(0, 2 ** 256)
+        items.append((keys[i % 8].point, z, keys[i % 8].sign(z)))
+
+    async def direct(point, z, signature):
+        return point.verify(z, signature)
+
+    async def batched():
+        executor = ProcessPoolExecutor() if args.executor == "process" else None
+        verifier = AsyncVerifier(args.batch_size, max_delay=0.002, executor=executor)
+        try:
+            return await run(items, verifier.verify)
+        finally:
+            await verifier.aclose()
+            if executor:
+                executor.shutdown()
+
+    report("direct", len(items), *asyncio.run(run(items, direct)))
+    report("AsyncVerifier", len(items), *asyncio.run(batched()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Arithmetic modulo the secp256k1 prime: specialized helpers compared to the generic
+operations used by FieldElement.
+
+Usage (from the python/ directory):
+    python -m benchmarks.field_arithmetic [--number 20000] [--seed 0]
+"""
+import argparse
+import random
+import timeit
+
+from littlebit.cryptography.secp256k1 import field
+from littlebit.cryptography.secp256k1.constants import P
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    a, b = rng.randrange(1, P), rng.randrange(1, P)
+    product = a * b
+
+    cases = (
+        # name, generic, specialized, relative cost
+        ("reduce", lambda: product % P, lambda: field.reduce(product), 1),
+        ("mul", lambda: (a * b) % P, lambda: field.mul(a, b), 1),
+        (
+            "inverse (Fermat vs chain)",
+            lambda: pow(a, P - 2, P),
+            lambda: field.inverse_chain(a),
+            100,
+        ),
+        (
+            "inverse (Fermat vs pow(a, -1))",
+            lambda: pow(a, P - 2, P),
+            lambda: field.inverse(a),
+            100,
+        ),
+        ("sqrt", lambda: pow(a, (P + 1) // 4, P), lambda: field.sqrt(a), 100),
+    )
+
+    print(
+        f"{'operation':<32} {'generic (ns)':>14} {'specialized (ns)':>18} {'speedup':>8}"
+    )
+    for name, generic, specialized, cost in cases:
+        assert generic() == specialized() or name.startswith("inverse")
+        number = max(args.number // cost, 1)
+        generic_ns = min(timeit.repeat(generic, number=number, repeat=5)) / number * 1e9
+        special_ns = (
+            min(timeit.repeat(specialized, number=number, repeat=5)) / number * 1e9
+        )
+        print(
+            f"{name:<32} {generic_ns:>14.0f} {special_ns:>18.0f} "
+            f"{generic_ns / special_ns:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
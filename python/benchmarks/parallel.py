@@ -0,0 +1,72 @@
+"""
+Scaling of ParallelSigner and ParallelVerifier from 1 to N worker processes.
+
+Usage (from the python/ directory):
+    python -m benchmarks.parallel [--items 512] [--chunk-size 32] [--max-workers N]
+"""
+import argparse
+import os
+import random
+import time
+
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.parallel import (
+    ParallelSigner,
+    ParallelVerifier,
+    sign_chunk,
+)
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--items", type=int, default=512)
+    parser.add_argument("--chunk-size", type=int, default=32)
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    secrets = [rng.randrange(1, N).to_bytes(32, "big") for _ in range(args.items)]
+    hashes = [rng.randrange(0, 2 ** 256).to_bytes(32, "big") for _ in range(args.items)]
+    sign_items = list(zip(secrets, hashes))
+
+    signatures = sign_chunk(sign_items)
+    public_keys = [
+        PrivateKey(int.from_bytes(secret, "big")).point.sec() for secret in secrets
+    ]
+    verify_items = list(zip(public_keys, signatures, hashes))
+
+    # 1, 2, 4, ... up to the maximum number of workers
+    worker_counts = sorted(
+        {
+            min(2 ** i, args.max_workers)
+            for i in range(args.max_workers.bit_length() + 1)
+        }
+    )
+
+    baseline = {}
+    print(
+        f"{'workers':>7} {'sign (op/s)':>12} {'scaling':>8} {'verify (op/s)':>14} {'scaling':>8}"
+    )
+    for workers in worker_counts:
+        rates = {}
+        with ParallelSigner(workers, args.chunk_size) as signer:
+            start = time.perf_counter()
+            assert signer.sign(sign_items) == signatures
+            rates["sign"] = args.items / (time.perf_counter() - start)
+
+        with ParallelVerifier(workers, args.chunk_size) as verifier:
+            start = time.perf_counter()
+            assert all(verifier.verify(verify_items))
+            rates["verify"] = args.items / (time.perf_counter() - start)
+
+        baseline = baseline or rates
+        print(
+            f"{workers:>7} {rates['sign']:>12.1f} {rates['sign'] / baseline['sign']:>7.2f}x"
+            f" {rates['verify']:>14.1f} {rates['verify'] / baseline['verify']:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,302 @@
+"""
+Microbenchmarks of the primitives of littlebit.
+
+Usage (from the python/ directory):
+    python -m benchmarks [--filter REGEX] [--json FILE] [--baseline FILE]
+                         [--threshold 0.10] [--repeat 5] [--seed 0]
+
+Every benchmark reports the best time per operation over several repeats. With
+--json, the results are written to a file, which can later be passed back with
+--baseline: any benchmark slower than its baseline by more than the threshold is
+reported as a regression, and the command exits with status 1.
+"""
+import argparse
+import json
+import platform
+import random
+import re
+import sys
+import timeit
+from typing import Any, Callable, Dict, List, Optional
+
+from littlebit.cryptography.field import FieldElement
+from littlebit.cryptography.point import Point
+from littlebit.cryptography.secp256k1.constants import N, P
+from littlebit.cryptography.secp256k1.field import S256FieldElement
+from littlebit.cryptography.secp256k1.point import G, S256Point
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+from littlebit.cryptography.secp256k1.signature import Signature
+from littlebit.cryptography.utils import (
+    decode_base58,
+    encode_base58,
+    encode_base58_checksum,
+    hash160,
+    hash256,
+)
+
+Setup = Callable[[random.Random], Callable[[], Any]]
+
+# Name of the benchmark -> function which prepares the inputs, using the given
+# random number generator, and returns the operation to time.
+BENCHMARKS: Dict[str, Setup] = {}
+
+
+def benchmark(name: str) -> Callable[[Setup], Setup]:
+    def register(setup: Setup) -> Setup:
+        BENCHMARKS[name] = setup
+        return setup
+
+    return register
+
+
+def _field_elements(rng: random.Random, cls=FieldElement):
+    a, b = rng.randrange(1, P), rng.randrange(1, P)
+    if cls is S256FieldElement:
+        return S256FieldElement(a), S256FieldElement(b)
+    return FieldElement(a, P), FieldElement(b, P)
+
+
+def _signed(rng: random.Random):
+    private_key = PrivateKey(rng.randrange(1, N))
+    z = rng.randrange(0, 2 ** 256)
+    return private_key, z, private_key.sign(z)
+
+
+@benchmark("field.add")
+def field_add(rng):
+    a, b = _field_elements(rng)
+    return lambda: a + b
+
+
+@benchmark("field.mul")
+def field_mul(rng):
+    a, b = _field_elements(rng)
+    return lambda: a * b
+
+
+@benchmark("field.pow")
+def field_pow(rng):
+    a, _ = _field_elements(rng)
+    exponent = rng.randrange(1, P)
+    return lambda: a ** exponent
+
+
+@benchmark("field.div")
+def field_div(rng):
+    a, b = _field_elements(rng)
+    return lambda: a / b
+
+
+@benchmark("s256field.mul")
+def s256field_mul(rng):
+    a, b = _field_elements(rng, S256FieldElement)
+    return lambda: a * b
+
+
+@benchmark("s256field.div")
+def s256field_div(rng):
+    a, b = _field_elements(rng, S256FieldElement)
+    return lambda: a / b
+
+
+@benchmark("s256field.sqrt")
+def s256field_sqrt(rng):
+    a, _ = _field_elements(rng, S256FieldElement)
+    return lambda: a.sqrt()
+
+
+@benchmark("point.add")
+def point_add(rng):
+    # Generic affine addition, with a field division
+    p, q = rng.randrange(1, N) * G, rng.randrange(1, N) * G
+    return lambda: Point.__add__(p, q)
+
+
+@benchmark("s256point.rmul.generator")
+def s256point_rmul_generator(rng):
+    k = rng.randrange(1, N)
+    return lambda: k * G
+
+
+@benchmark("s256point.rmul")
+def s256point_rmul(rng):
+    point, k = rng.randrange(1, N) * G, rng.randrange(1, N)
+    return lambda: k * point
+
+
+@benchmark("private_key.sign")
+def private_key_sign(rng):
+    private_key, z, _ = _signed(rng)
+    return lambda: private_key.sign(z)
+
+
+@benchmark("s256point.verify")
+def s256point_verify(rng):
+    private_key, z, signature = _signed(rng)
+    point = private_key.point
+    return lambda: point.verify(z, signature)
+
+
+@benchmark("sec.serialize.compressed")
+def sec_serialize_compressed(rng):
+    # S256Point.sec() caches its result, so time the uncached serialization
+    point = rng.randrange(1, N) * G
+    return lambda: point._sec(True)
+
+
+@benchmark("sec.serialize.uncompressed")
+def sec_serialize_uncompressed(rng):
+    point = rng.randrange(1, N) * G
+    return lambda: point._sec(False)
+
+
+@benchmark("sec.parse.compressed")
+def sec_parse_compressed(rng):
+    sec = (rng.randrange(1, N) * G).sec(compressed=True)
+    return lambda: S256Point.parse(sec, cache=False)
+
+
+@benchmark("sec.parse.uncompressed")
+def sec_parse_uncompressed(rng):
+    sec = (rng.randrange(1, N) * G).sec(compressed=False)
+    return lambda: S256Point.parse(sec, cache=False)
+
+
+@benchmark("der.serialize")
+def der_serialize(rng):
+    signature = Signature(rng.randrange(1, N), rng.randrange(1, N))
+    return lambda: signature.der()
+
+
+@benchmark("der.parse")
+def der_parse(rng):
+    der = Signature(rng.randrange(1, N), rng.randrange(1, N)).der()
+    return lambda: Signature.parse(der)
+
+
+@benchmark("base58.encode")
+def base58_encode(rng):
+    data = b"\x00" + rng.getrandbits(192).to_bytes(24, "big")  # address-sized
+    return lambda: encode_base58(data)
+
+
+@benchmark("base58.decode")
+def base58_decode(rng):
+    string = encode_base58(b"\x00" + rng.getrandbits(192).to_bytes(24, "big"))
+    return lambda: decode_base58(string)
+
+
+@benchmark("base58.encode_checksum")
+def base58_encode_checksum(rng):
+    data = b"\x00" + rng.getrandbits(160).to_bytes(20, "big")
+    return lambda: encode_base58_checksum(data)
+
+
+@benchmark("hash.hash160")
+def hash_hash160(rng):
+    data = rng.getrandbits(264).to_bytes(33, "big")
+    return lambda: hash160(data)
+
+
+@benchmark("hash.hash256")
+def hash_hash256(rng):
+    data = rng.getrandbits(256).to_bytes(32, "big")
+    return lambda: hash256(data)
+
+
+def measure(operation: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    timer = timeit.Timer(operation)
+    number, _ = timer.autorange()  # enough iterations to run for at least 0.2s
+    best = min(timer.repeat(repeat=repeat, number=number))
+    return {"ns_per_op": best / number * 1e9, "number": number}
+
+
+def run(pattern: str, repeat: int, seed: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if not re.search(pattern, name):
+            continue
+
+        # Each benchmark gets its own generator, so that its inputs don't depend
+        # on which other benchmarks were selected.
+        operation = setup(random.Random(f"{seed}:{name}"))
+        operation()  # warm up lazily built tables and caches
+        results[name] = measure(operation, repeat)
+        print(f"{name:<28} {results[name]['ns_per_op']:>14,.0f} ns/op", flush=True)
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]], baseline: Dict[str, Any], threshold: float
+) -> List[str]:
+    """
+    Prints the ratio of every result to its baseline, and returns the names of the
+    benchmarks which regressed by more than the threshold.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<28} {'baseline':>14} {'current':>14} {'ratio':>7}")
+    for name, result in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            print(f"{name:<28} {'-':>14} {result['ns_per_op']:>14,.0f}")
+            continue
+
+        ratio = result["ns_per_op"] / previous["ns_per_op"]
+        status = ""
+        if ratio > 1 + threshold:
+            status = "  REGRESSION"
+            regressions.append(name)
+        elif ratio < 1 - threshold:
+            status = "  improvement"
+        print(
+            f"{name:<28} {previous['ns_per_op']:>14,.0f} "
+            f"{result['ns_per_op']:>14,.0f} {ratio:>6.2f}x{status}"
+        )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description="Microbenchmarks of littlebit."
+    )
+    parser.add_argument("--filter", default="", help="regex on benchmark names")
+    parser.add_argument("--json", help="write the results to this file")
+    parser.add_argument("--baseline", help="compare to results saved with --json")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.10,
+        help="relative slowdown reported as a regression (default: 0.10)",
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--list", action="store_true", help="list the benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    results = run(args.filter, args.repeat, args.seed)
+
+    if args.json:
+        report = {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.json, "w") as f:
+            json.dump(report, f, indent=2, sort_keys=True)
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
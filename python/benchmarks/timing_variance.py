@@ -0,0 +1,82 @@
+"""
+Latency variance of S256Point scalar multiplication across classes of scalars, with
+and without the constant-time Montgomery ladder.
+
+For each mode, the harness reports the mean latency of every class of scalars, the
+spread between the slowest and the fastest class (how much timing reveals about the
+scalar), the coefficient of variation over all samples, and the throughput. The
+last line gives the throughput cost of enabling point.CONSTANT_TIME.
+
+Usage (from the python/ directory):
+    python -m benchmarks.timing_variance [--samples 30] [--base G|random] [--seed 0]
+"""
+import argparse
+import random
+import statistics
+import time
+
+from littlebit.cryptography.secp256k1 import point
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.point import G
+
+
+def scalar_classes(rng: random.Random, samples: int):
+    return {
+        "random": [rng.randrange(1, N) for _ in range(samples)],
+        "short (64 bits)": [rng.randrange(1, 2 ** 64) for _ in range(samples)],
+        "low weight": [1 << rng.randrange(0, 256) for _ in range(samples)],
+        "high weight": [N - rng.randrange(1, 2 ** 32) for _ in range(samples)],
+    }
+
+
+def measure(base, scalars, constant_time: bool):
+    point.CONSTANT_TIME = constant_time
+    try:
+        timings = []
+        for scalar in scalars:
+            start = time.perf_counter_ns()
+            scalar * base
+            timings.append((time.perf_counter_ns() - start) / 1000)
+        return timings
+    finally:
+        point.CONSTANT_TIME = False
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--samples", type=int, default=30)
+    parser.add_argument("--base", choices=("G", "random"), default="G")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    base = G if args.base == "G" else rng.randrange(1, N) * G
+    classes = scalar_classes(rng, args.samples)
+
+    1 * base  # warm up the lazily built tables
+    throughput = {}
+    for constant_time in (False, True):
+        mode = "constant-time ladder" if constant_time else "default"
+        print(f"{mode} (base={args.base}, {args.samples} samples per class)")
+
+        means, samples = [], []
+        for name, scalars in classes.items():
+            timings = measure(base, scalars, constant_time)
+            means.append(statistics.mean(timings))
+            samples += timings
+            print(f"    {name:<18} mean {means[-1]:>9.1f} µs")
+
+        mean = statistics.mean(samples)
+        spread = (max(means) - min(means)) / mean
+        variation = statistics.stdev(samples) / mean
+        throughput[constant_time] = 1e6 / mean
+        print(f"    class spread       {spread:>9.1%}")
+        print(f"    coeff. variation   {variation:>9.1%}")
+        print(f"    throughput         {throughput[constant_time]:>9.1f} ops/s")
+
+    cost = throughput[False] / throughput[True]
+    print(f"constant-time ladder is {cost:.2f}x slower than the default mode")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Throughput of verify_batch compared to one S256Point.verify call per signature.
+
+Usage (from the python/ directory):
+    python -m benchmarks.verify_batch [--sizes 1 8 64 256] [--keys 16]
+"""
+import argparse
+import random
+import time
+
+from littlebit.cryptography.secp256k1 import verify_batch
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+def make_items(size: int, keys: int, rng: random.Random):
+    private_keys = [PrivateKey(rng.randrange(1, N)) for _ in range(keys)]
+    items = []
+    for i in range(size):
+        private_key = private_keys[i % keys]
+        z = rng.randrange(0, 2 ** 256)
+        items.append((private_key.point, z, private_key.sign(z)))
+    return items
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1, 8, 64, 256])
+    parser.add_argument("--keys", type=int, default=16, help="distinct public keys")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+
+    # Warm up the lazily built tables for G, so that they don't skew the first run
+    verify_batch(make_items(1, 1, rng))
+
+    print(
+        f"{'size':>6} {'verify (sig/s)':>16} {'verify_batch (sig/s)':>22} {'speedup':>8}"
+    )
+    for size in args.sizes:
+        items = make_items(size, args.keys, rng)
+
+        start = time.perf_counter()
+        assert all(point.verify(z, signature) for point, z, signature in items)
+        single = size / (time.perf_counter() - start)
+
+        start = time.perf_counter()
+        assert all(verify_batch(items))
+        batch = size / (time.perf_counter() - start)
+
+        print(f"{size:>6} {single:>16.1f} {batch:>22.1f} {batch / single:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
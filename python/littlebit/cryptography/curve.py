@@ -0,0 +1,103 @@
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .field import FieldElement
+
+
+def _value(value: Any) -> Hashable:
+    # FieldElement is mutable, hence not hashable, so curves are keyed by value
+    if isinstance(value, FieldElement):
+        return value.number, value.prime
+    return value
+
+
+class Curve:
+    """
+    Elliptic curve y² = x³ + ax + b, shared by all of its points.
+
+    Curves are interned: Curve.of() returns the same instance for the same a and b,
+    so that checking whether two points are on the same curve is usually a plain
+    identity comparison.
+
+    Attributes:
+        a, b: coefficients of the curve, FieldElement instances or plain numbers.
+        p: order of the field of the coefficients, or None for plain numbers.
+        n: order of the group generated by G, if known.
+        G: generator point, if known.
+        a_is_zero: whether the a coefficient is zero, which simplifies the point
+            arithmetic. This is the case for secp256k1.
+    """
+
+    def __init__(
+        self,
+        a: Any,
+        b: Any,
+        n: Optional[int] = None,
+        generator: Optional[Callable[[], Any]] = None,
+    ):
+        """
+        generator: function returning the generator point G. It is only called when
+            G is first needed, so that defining a curve stays cheap.
+        """
+        self.a = a
+        self.b = b
+        self.p = a.prime if isinstance(a, FieldElement) else None
+        self.n = n
+        self.a_is_zero = (a.number if isinstance(a, FieldElement) else a) == 0
+        self._generator = generator
+
+    @classmethod
+    def of(
+        cls,
+        a: Any,
+        b: Any,
+        n: Optional[int] = None,
+        generator: Optional[Callable[[], Any]] = None,
+    ) -> "Curve":
+        """
+        Returns the interned curve with coefficients a and b, creating it if needed.
+
+        The curve may already have been interned without n or G, e.g. by a Point
+        built from bare coefficients, or by unpickling, before the module which
+        defines the curve was imported. The missing attributes are then filled in.
+        """
+        # The types are part of the key, so that the coefficients of the interned
+        # curve are of the same type as the ones given, e.g. S256FieldElement.
+        key = (type(a), _value(a), type(b), _value(b))
+        curve = _CURVES.get(key)
+        if curve is None:
+            curve = _CURVES[key] = cls(a, b, n, generator)
+            return curve
+
+        if n is not None:
+            if curve.n is None:
+                curve.n = n
+            elif curve.n != n:
+                raise ValueError(f"{curve} already has a group order of {curve.n}")
+        if generator is not None and curve._generator is None:
+            curve._generator = generator
+        return curve
+
+    @property
+    def G(self) -> Any:
+        return self._generator() if self._generator else None
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Curve):
+            return NotImplemented
+        return self is other or (
+            _value(self.a) == _value(other.a) and _value(self.b) == _value(other.b)
+        )
+
+    def __hash__(self) -> int:
+        return hash((_value(self.a), _value(self.b)))
+
+    def __repr__(self):
+        return f"Curve(a={self.a}, b={self.b})"
+
+    def __reduce__(self) -> Tuple:
+        # Unpickling, e.g. in another process, gets the interned instance back
+        return Curve.of, (self.a, self.b, self.n)
+
+
+# Every curve created with Curve.of(). There are only ever a handful of them.
+_CURVES: Dict[Hashable, Curve] = {}
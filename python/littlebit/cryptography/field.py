@@ -1,8 +1,13 @@
 from dataclasses import dataclass
+from typing import List, Sequence
 
 
 @dataclass
 class FieldElement:
+    # Field elements are created by the million during point arithmetic, so we
+    # avoid the per-instance __dict__.
+    __slots__ = ("number", "prime")
+
     number: int
     prime: int
 
@@ -91,3 +96,50 @@ class FieldElement:
         return type(self)(
             number=(self.number * coefficient) % self.prime, prime=self.prime
         )
+
+    @classmethod
+    def batch_inverse(cls, elements: Sequence["FieldElement"]) -> List["FieldElement"]:
+        """
+        Inverts all the given elements of the same field, using a single modular
+        exponentiation. See batch_inverse_mod() for details.
+        """
+        if not elements:
+            return []
+
+        prime = elements[0].prime
+        if any(element.prime != prime for element in elements):
+            raise TypeError("Cannot invert numbers in different Fields together")
+
+        numbers = batch_inverse_mod([element.number for element in elements], prime)
+        return [cls(number=number, prime=prime) for number in numbers]
+
+
+def batch_inverse_mod(numbers: Sequence[int], modulus: int) -> List[int]:
+    ###############################################################################
+    # Montgomery's batch inversion trick                                          #
+    #                                                                             #
+    # Formula:                                                                    #
+    #     cᵢ = a₁a₂...aᵢ                                                          #
+    #     1/aᵢ = cᵢ₋₁ x (1/cᵢ)                                                    #
+    #     1/cᵢ₋₁ = aᵢ x (1/cᵢ)                                                    #
+    #                                                                             #
+    # Only the last product cₙ is inverted. All the other inverses are then       #
+    # recovered from it, walking backwards, with 3(n-1) multiplications in total. #
+    ###############################################################################
+    prefixes = []
+    product = 1
+    for number in numbers:
+        if not number % modulus:
+            raise ZeroDivisionError("Cannot invert zero")
+
+        prefixes.append(product)
+        product = (product * number) % modulus
+
+    # The single modular inversion of the whole batch
+    inverse = pow(product, -1, modulus)
+
+    result = [0] * len(numbers)
+    for i in reversed(range(len(numbers))):
+        result[i] = (inverse * prefixes[i]) % modulus
+        inverse = (inverse * numbers[i]) % modulus
+    return result
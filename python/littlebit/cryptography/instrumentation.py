@@ -0,0 +1,292 @@
+"""
+Opt-in instrumentation of the arithmetic hot paths.
+
+Usage:
+    from littlebit.cryptography import instrumentation
+
+    with instrumentation.profile() as result:
+        signature = private_key.sign(z)
+        point.verify(z, signature)
+
+    result.as_dict()        # {"operations": {...}, "calls": {...}}
+    result.to_prometheus()  # Prometheus text exposition format
+
+While a profile is active, the following are recorded:
+    - operations: field additions, subtractions, multiplications, inversions,
+      exponentiations and square roots, and point additions and doublings,
+    - calls: number of calls to, and wall time spent in, PrivateKey.sign,
+      S256Point.verify, S256Point.parse and Signature.parse.
+
+Nothing is instrumented outside of a profile: entering the first profile replaces
+the instrumented methods and functions with counting wrappers, and leaving the
+last one puts the originals back, so the disabled cost is exactly zero.
+
+The secp256k1 kernels (jacobian.py, ladder.py) work on plain integers, so their
+field multiplications and inversions can't be intercepted one by one. Every call
+to a kernel function is counted instead, together with the number of field
+operations that its formula performs.
+
+Profiles are process-wide: operations performed by other threads while a profile
+is active are recorded too.
+"""
+import functools
+import threading
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+# Number of field multiplications, squarings included, done by each kernel formula
+JACOBIAN_DOUBLE_MULS = 7
+JACOBIAN_ADD_MULS = 16
+JACOBIAN_ADD_AFFINE_MULS = 11
+COMPLETE_ADD_MULS = 14
+
+
+class Profile:
+    def __init__(self):
+        self.operations: Counter = Counter()
+        self.calls: Counter = Counter()
+        self.seconds: Dict[str, float] = defaultdict(float)
+
+    def as_dict(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "operations": dict(sorted(self.operations.items())),
+            "calls": {
+                name: {"count": self.calls[name], "seconds": self.seconds[name]}
+                for name in sorted(self.calls)
+            },
+        }
+
+    def to_prometheus(self, prefix: str = "littlebit") -> str:
+        lines = [
+            f"# HELP {prefix}_operations_total Arithmetic operations performed.",
+            f"# TYPE {prefix}_operations_total counter",
+        ]
+        for name, count in sorted(self.operations.items()):
+            lines.append(f'{prefix}_operations_total{{operation="{name}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_calls_total Calls to the instrumented functions.",
+            f"# TYPE {prefix}_calls_total counter",
+        ]
+        for name, count in sorted(self.calls.items()):
+            lines.append(f'{prefix}_calls_total{{call="{name}"}} {count}')
+
+        lines += [
+            f"# HELP {prefix}_call_seconds_total Wall time spent in the instrumented "
+            "functions.",
+            f"# TYPE {prefix}_call_seconds_total counter",
+        ]
+        for name, seconds in sorted(self.seconds.items()):
+            lines.append(f'{prefix}_call_seconds_total{{call="{name}"}} {seconds!r}')
+        return "\n".join(lines) + "\n"
+
+
+# Profiles currently recording, innermost last
+_PROFILES: List[Profile] = []
+# (owner, attribute name, original value) of everything replaced by a wrapper
+_ORIGINALS: List[Tuple[Any, str, Any]] = []
+_LOCK = threading.Lock()
+
+
+def enabled() -> bool:
+    return bool(_ORIGINALS)
+
+
+def _count(operation: str, count: int = 1):
+    for profile in _PROFILES:
+        profile.operations[operation] += count
+
+
+def _counted(operations: Dict[str, int]) -> Callable[[Callable], Callable]:
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            for operation, count in operations.items():
+                _count(operation, count)
+            return function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def _timed(name: str) -> Callable[[Callable], Callable]:
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start = perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = perf_counter() - start
+                for profile in _PROFILES:
+                    profile.calls[name] += 1
+                    profile.seconds[name] += elapsed
+
+        return wrapper
+
+    return decorator
+
+
+def _point_add(function: Callable) -> Callable:
+    # The generic Point.__add__, whose field operations are counted separately
+    @functools.wraps(function)
+    def wrapper(self, other):
+        if not (self.is_identity or other.is_identity):
+            _count("point_double" if self == other else "point_add")
+        return function(self, other)
+
+    return wrapper
+
+
+def _jacobian_double(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(point):
+        if point[2] and point[1]:
+            _count("point_double")
+            _count("field_mul", JACOBIAN_DOUBLE_MULS)
+        return function(point)
+
+    return wrapper
+
+
+def _jacobian_add(muls: int) -> Callable[[Callable], Callable]:
+    # add() and add_affine(); the second point of add_affine() has no Z, and is
+    # never the point at infinity.
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(p, q):
+            if p[2] and (len(q) == 2 or q[2]):
+                _count("point_add")
+                _count("field_mul", muls)
+            return function(p, q)
+
+        return wrapper
+
+    return decorator
+
+
+def _complete_add(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(p, q):
+        _count("point_double" if p is q else "point_add")
+        _count("field_mul", COMPLETE_ADD_MULS)
+        return function(p, q)
+
+    return wrapper
+
+
+def _to_affine(muls: int) -> Callable[[Callable], Callable]:
+    def decorator(function: Callable) -> Callable:
+        @functools.wraps(function)
+        def wrapper(point):
+            if point[2]:
+                _count("field_inv")
+                _count("field_mul", muls)
+            return function(point)
+
+        return wrapper
+
+    return decorator
+
+
+def _to_affine_batch(function: Callable) -> Callable:
+    # The inversion itself is counted by batch_inverse_mod()
+    @functools.wraps(function)
+    def wrapper(points):
+        _count("field_mul", 4 * sum(1 for point in points if point[2]))
+        return function(points)
+
+    return wrapper
+
+
+def _batch_inverse_mod(function: Callable) -> Callable:
+    @functools.wraps(function)
+    def wrapper(numbers, modulus):
+        if numbers:
+            _count("field_inv")
+            _count("field_mul", 3 * (len(numbers) - 1))
+        return function(numbers, modulus)
+
+    return wrapper
+
+
+def _patch(owner: Any, name: str, decorator: Callable[[Callable], Callable]):
+    original = vars(owner)[name]
+    if isinstance(original, classmethod):
+        replacement: Any = classmethod(decorator(original.__func__))
+    else:
+        replacement = decorator(original)
+
+    _ORIGINALS.append((owner, name, original))
+    setattr(owner, name, replacement)
+
+
+def _install():
+    # Imported here, so that importing this module doesn't load secp256k1
+    from . import field, point
+    from .secp256k1 import batch, jacobian, ladder
+    from .secp256k1 import point as s256_point
+    from .secp256k1 import private_key, signature
+    from .secp256k1.field import S256FieldElement
+
+    field_operations = {
+        "__add__": {"field_add": 1},
+        "__sub__": {"field_sub": 1},
+        "__mul__": {"field_mul": 1},
+        "__rmul__": {"field_mul": 1},
+        "__pow__": {"field_pow": 1},
+        "__truediv__": {"field_inv": 1, "field_mul": 1},
+        "sqrt": {"field_sqrt": 1},
+    }
+    for cls in (field.FieldElement, S256FieldElement):
+        for name, operations in field_operations.items():
+            # Only patch the methods defined by the class itself
+            if name in vars(cls):
+                _patch(cls, name, _counted(operations))
+
+    _patch(point.Point, "__add__", _point_add)
+
+    _patch(jacobian, "double", _jacobian_double)
+    _patch(jacobian, "add", _jacobian_add(JACOBIAN_ADD_MULS))
+    _patch(jacobian, "add_affine", _jacobian_add(JACOBIAN_ADD_AFFINE_MULS))
+    _patch(jacobian, "to_affine", _to_affine(4))
+    _patch(jacobian, "to_affine_batch", _to_affine_batch)
+    _patch(ladder, "complete_add", _complete_add)
+    _patch(ladder, "to_affine", _to_affine(2))
+    for module in (field, jacobian, batch):
+        _patch(module, "batch_inverse_mod", _batch_inverse_mod)
+
+    _patch(private_key.PrivateKey, "sign", _timed("sign"))
+    _patch(s256_point.S256Point, "verify", _timed("verify"))
+    _patch(s256_point.S256Point, "parse", _timed("parse_sec"))
+    _patch(signature.Signature, "parse", _timed("parse_der"))
+
+
+def _uninstall():
+    while _ORIGINALS:
+        owner, name, original = _ORIGINALS.pop()
+        setattr(owner, name, original)
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    Records the operations performed inside the with block into a new Profile.
+    Profiles can be nested: an outer profile also records everything recorded by
+    the inner ones.
+    """
+    result = Profile()
+    with _LOCK:
+        if not _PROFILES:
+            _install()
+        _PROFILES.append(result)
+    try:
+        yield result
+    finally:
+        with _LOCK:
+            _PROFILES.remove(result)
+            if not _PROFILES:
+                _uninstall()
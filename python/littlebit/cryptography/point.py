@@ -1,38 +1,90 @@
-from dataclasses import dataclass
+from typing import Optional, Type, TypeVar
 
+from .curve import Curve
 from .field import FieldElement
 
+# Points are checked to be on their curve when they are created by the public
+# constructor, which is where untrusted coordinates come in. The results of point
+# arithmetic are created with Point._unchecked() instead, and are only checked when
+# DEBUG is set, e.g. by the test suite.
+DEBUG = False
+
+PointType = TypeVar("PointType", bound="Point")
+
 
-@dataclass
 class Point:
-    x: FieldElement
-    y: FieldElement
-    a: FieldElement
-    b: FieldElement
+    def __init__(
+        self,
+        x: FieldElement,
+        y: FieldElement,
+        a: Optional[FieldElement] = None,
+        b: Optional[FieldElement] = None,
+        curve: Optional[Curve] = None,
+    ):
+        """
+        The curve is either given directly, or by its coefficients a and b. In the
+        latter case, all the points with equal coefficients share the same Curve
+        instance, see Curve.of().
+        """
+        self.x = x
+        self.y = y
+        self.curve = curve if curve is not None else Curve.of(a, b)
+        self._check()
+
+    @classmethod
+    def _unchecked(cls: Type[PointType], x, y, curve: Curve) -> PointType:
+        """
+        Internal constructor for points which are on the curve by construction, such
+        as the sum of two valid points. It skips the curve equation check.
+        """
+        point = object.__new__(cls)
+        point.x, point.y, point.curve = x, y, curve
+        if DEBUG:
+            point._check()
+        return point
+
+    @property
+    def a(self) -> FieldElement:
+        return self.curve.a
+
+    @property
+    def b(self) -> FieldElement:
+        return self.curve.b
 
     @property
     def is_identity(self):
         return self.x is None and self.y is None
 
-    def __post_init__(self):
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}"
+            f"(x={self.x!r}, y={self.y!r}, a={self.a!r}, b={self.b!r})"
+        )
+
+    def _check(self):
         # Skip curve validation is point is at infinity, denoted by x=None and y=None.
         if self.is_identity:
             return
 
         # Check if the params satisfy the elliptic curve equation: y² = x³ + ax + b
-        if self.y ** 2 != self.x ** 3 + self.a * self.x + self.b:
+        if self.curve.a_is_zero:
+            right = self.x ** 3 + self.b
+        else:
+            right = self.x ** 3 + self.a * self.x + self.b
+        if self.y ** 2 != right:
             raise ValueError(f"({self.x}, {self.y}) is not on the elliptic curve")
 
     def __eq__(self, other):
+        # Curves are interned, so the curves of two points are almost always either
+        # the same object, or different curves.
         return (
             self.x == other.x
             and self.y == other.y
-            and self.a == other.a
-            and self.b == other.b
+            and (self.curve is other.curve or self.curve == other.curve)
         )
 
     def __add__(self, other):
-        if self.a != other.a or self.b != other.b:
+        if self.curve is not other.curve and self.curve != other.curve:
             raise TypeError(f"Points {self} and {other} are not on the same curve")
 
         ###############################################################################
@@ -56,7 +108,7 @@ class Point:
         #     (-P) + P = I                                                            #
         ###############################################################################
         if self.x == other.x and self.y != other.y:
-            return type(self)(x=None, y=None, a=self.a, b=self.b)
+            return self._unchecked(None, None, self.curve)
 
         ###############################################################################
         # Point Addition for X₁ ≠ X₂   (line with slope)                              #
@@ -74,7 +126,7 @@ class Point:
             x3 = s ** 2 - x1 - x2
             y3 = s * (x1 - x3) - y1
 
-            return type(self)(x=x3, y=y3, a=self.a, b=self.b)
+            return self._unchecked(x3, y3, self.curve)
 
         ###############################################################################
         # Point Addition for P₁ = P₂   (vertical tangent)                             #
@@ -84,7 +136,7 @@ class Point:
         #     (X₃, Y₃) = I                                                            #
         ###############################################################################
         if self == other and self.y == 0 * self.x:  # 0 * self.x = I
-            return type(self)(x=None, y=None, a=self.a, b=self.b)
+            return self._unchecked(None, None, self.curve)
 
         ###############################################################################
         # Point Addition for P₁ = P₂   (tangent with slope)                           #
@@ -95,13 +147,16 @@ class Point:
         #     Y₃ = S(X₁ - X₃) - Y₁                                                    #
         ###############################################################################
         if self == other:
-            x1, y1, a = self.x, self.y, self.a
+            x1, y1 = self.x, self.y
 
-            s = (3 * x1 ** 2 + a) / (2 * y1)
+            if self.curve.a_is_zero:
+                s = (3 * x1 ** 2) / (2 * y1)
+            else:
+                s = (3 * x1 ** 2 + self.a) / (2 * y1)
             x3 = s ** 2 - 2 * x1
             y3 = s * (x1 - x3) - y1
 
-            return type(self)(x=x3, y=y3, a=self.a, b=self.b)
+            return self._unchecked(x3, y3, self.curve)
 
     def __rmul__(self, coefficient):
         # Naive approach:
@@ -114,7 +169,7 @@ class Point:
         # [TODO] - Explain me
         coef = coefficient
         current = self
-        result = type(self)(x=None, y=None, a=self.a, b=self.b)
+        result = self._unchecked(None, None, self.curve)
         while coef:
             if coef & 1:
                 result += current
@@ -0,0 +1,11 @@
+__all__ = ["verify_batch"]
+
+
+def __getattr__(name):
+    # Submodules are imported on first use, so that importing a single one, such as
+    # secp256k1.private_key, doesn't load the whole package.
+    if name == "verify_batch":
+        from .batch import verify_batch
+
+        return verify_batch
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
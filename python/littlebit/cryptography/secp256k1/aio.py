@@ -0,0 +1,186 @@
+"""
+asyncio front-end for signing and verification.
+
+Calling PrivateKey.sign or S256Point.verify from a coroutine blocks the event loop
+for milliseconds. The classes below queue the requests instead, coalesce them into
+micro-batches, and run each batch off the event loop, in an executor:
+    - a batch is dispatched as soon as it holds max_batch_size requests, or when
+      max_delay seconds have passed since its first request, whichever comes first,
+    - verification batches go through verify_batch, which shares work across the
+      whole batch.
+
+The default executor of the event loop is a thread pool, whose threads still
+compete with the event loop for the GIL. Passing a ProcessPoolExecutor keeps the
+event loop latency flat, see benchmarks/async_latency.py.
+
+Usage:
+    verifier = AsyncVerifier(max_batch_size=64, max_delay=0.002)
+    ok = await verifier.verify(point, z, signature)
+    ...
+    await verifier.aclose()
+"""
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .batch import verify_batch
+from .point import S256Point
+from .private_key import PrivateKey
+from .signature import Signature
+
+# Sentinel put in the queue to stop the collector
+_CLOSE: Any = object()
+
+
+def _sign_batch(items: List[Tuple[PrivateKey, int]]) -> List[Signature]:
+    return [private_key.sign(z) for private_key, z in items]
+
+
+class _MicroBatcher:
+    _batch_function: Any = None
+
+    def __init__(
+        self,
+        max_batch_size: int = 64,
+        max_delay: float = 0.002,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        max_batch_size: maximum number of requests in a batch.
+        max_delay: maximum time, in seconds, a request waits for its batch to fill.
+        executor: where batches run, defaults to the default executor of the loop.
+        """
+        if max_batch_size < 1:
+            raise ValueError(f"max_batch_size must be positive, got {max_batch_size}")
+
+        self.max_batch_size = max_batch_size
+        self.max_delay = max_delay
+        self.executor = executor
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._arrival: Optional[asyncio.Event] = None
+        self._collector: Optional[asyncio.Task] = None
+        self._in_flight: set = set()
+
+        self._pending = 0
+        self._batches = 0
+        self._items = 0
+        self._max_batch = 0
+        self._last_batch = 0
+
+    def metrics(self) -> Dict[str, float]:
+        return {
+            # Requests submitted, but not answered yet
+            "pending": self._pending,
+            # Requests waiting in the queue, not yet part of a batch
+            "queue_depth": self._queue.qsize() if self._queue else 0,
+            "batches_in_flight": len(self._in_flight),
+            "batches": self._batches,
+            "items": self._items,
+            "last_batch_size": self._last_batch,
+            "max_batch_size": self._max_batch,
+            "mean_batch_size": self._items / self._batches if self._batches else 0.0,
+        }
+
+    async def _submit(self, item) -> Any:
+        if self._queue is None or self._arrival is None:
+            # Created lazily, to bind to the event loop actually running us
+            self._queue = asyncio.Queue()
+            self._arrival = asyncio.Event()
+            self._collector = asyncio.ensure_future(self._collect())
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future))
+        self._arrival.set()
+
+        self._pending += 1
+        try:
+            return await future
+        finally:
+            self._pending -= 1
+
+    async def _collect(self):
+        loop = asyncio.get_running_loop()
+        queue, arrival = self._queue, self._arrival
+        closing = False
+        while not closing:
+            entry = await queue.get()
+            if entry is _CLOSE:
+                break
+
+            batch = [entry]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch_size:
+                if queue.empty():
+                    # Wait for more requests, but no longer than the deadline
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+
+                    arrival.clear()
+                    try:
+                        await asyncio.wait_for(arrival.wait(), timeout)
+                    except asyncio.TimeoutError:
+                        break
+                    continue
+
+                entry = queue.get_nowait()
+                if entry is _CLOSE:
+                    closing = True
+                    break
+                batch.append(entry)
+
+            task = asyncio.ensure_future(self._run(batch))
+            self._in_flight.add(task)
+            task.add_done_callback(self._in_flight.discard)
+
+    async def _run(self, batch: List[Tuple[Any, asyncio.Future]]):
+        self._batches += 1
+        self._items += len(batch)
+        self._last_batch = len(batch)
+        self._max_batch = max(self._max_batch, len(batch))
+
+        items = [item for item, _ in batch]
+        loop = asyncio.get_running_loop()
+        try:
+            results = await loop.run_in_executor(
+                self.executor, type(self)._batch_function, items
+            )
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+    async def aclose(self):
+        """
+        Processes the requests already queued, waits for them to complete, and
+        stops the collector.
+        """
+        if self._collector is None:
+            return
+
+        self._queue.put_nowait(_CLOSE)
+        self._arrival.set()
+        await self._collector
+        if self._in_flight:
+            await asyncio.gather(*self._in_flight)
+        self._collector = self._queue = self._arrival = None
+
+
+class AsyncVerifier(_MicroBatcher):
+    _batch_function = staticmethod(verify_batch)
+
+    async def verify(self, point: S256Point, z: int, signature: Signature) -> bool:
+        return await self._submit((point, z, signature))
+
+
+class AsyncSigner(_MicroBatcher):
+    _batch_function = staticmethod(_sign_batch)
+
+    async def sign(self, private_key: PrivateKey, z: int) -> Signature:
+        return await self._submit((private_key, z))
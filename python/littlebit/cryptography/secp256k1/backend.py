@@ -0,0 +1,45 @@
+"""
+Selection of the arithmetic backend used by bulk operations, such as
+derive_addresses().
+
+    "python"  plain Python integers, one element at a time. This is the default.
+    "numpy"   vectorized multi-limb arithmetic over whole batches, see
+              vectorized.py. It requires NumPy, which is an optional dependency.
+    "auto"    "numpy" if NumPy is installed, "python" otherwise.
+"""
+from typing import List
+
+BACKENDS = ("python", "numpy")
+
+_backend = "python"
+
+
+def numpy_available() -> bool:
+    try:
+        import numpy  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+def available_backends() -> List[str]:
+    return [name for name in BACKENDS if name != "numpy" or numpy_available()]
+
+
+def set_backend(name: str):
+    global _backend
+
+    if name == "auto":
+        name = "numpy" if numpy_available() else "python"
+
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown backend {name!r}, expected one of {BACKENDS}")
+
+    if name == "numpy" and not numpy_available():
+        raise ImportError("The numpy backend requires NumPy to be installed")
+
+    _backend = name
+
+
+def get_backend() -> str:
+    return _backend
@@ -0,0 +1,77 @@
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Union
+
+from ..field import batch_inverse_mod
+from . import glv, jacobian
+from .constants import N, P
+from .jacobian import AffinePoint, JacobianPoint
+from .point import S256Point, generator_glv_tables, glv_tables
+from .signature import Signature
+
+if TYPE_CHECKING:
+    from .point_batch import PointView
+
+
+def _has_x_coordinate(point: JacobianPoint, r: int) -> bool:
+    # The affine x coordinate is X / Z², so x == r is checked as X == r * Z², which
+    # doesn't need any field inversion.
+    X, _, Z = point
+    if not Z:
+        return False
+
+    zz = (Z * Z) % P
+    if X == (r * zz) % P:
+        return True
+
+    # r is the x coordinate reduced modulo N. Since N < P, x might also be r + N.
+    return r + N < P and X == ((r + N) * zz) % P
+
+
+def verify_batch(
+    items: Iterable[Tuple[Union[S256Point, "PointView"], int, Signature]]
+) -> List[bool]:
+    """
+    Verifies many (public point, z, signature) triples at once, and returns the
+    result of each verification, in the same order as the input. The points can
+    also be the views of a PointBatch.
+
+    Work is shared across the batch in the following ways:
+        1. All the s values are inverted modulo N with a single inversion.
+        2. Tables of odd multiples are computed once per distinct public key, and
+           the table for G is shared by every item.
+        3. Each u * G + v * Q is a single GLV multi-scalar multiplication, and the
+           result is compared to r in Jacobian coordinates, so no item needs a
+           conversion back to affine coordinates.
+
+    Unlike Schnorr signatures, an ECDSA signature does not commit to the full point
+    R, but only to its x coordinate. Therefore, the signatures can't be soundly
+    combined into a single random linear combination, and the all-valid check is
+    simply the cheap projective comparison above, which also pinpoints the bad
+    entries for free.
+    """
+    items = list(items)
+    results = [False] * len(items)
+
+    # Signatures with r or s out of range are invalid, and s must not be zero for
+    # the batch inversion to work.
+    candidates = [
+        i
+        for i, (point, _, signature) in enumerate(items)
+        if 0 < signature.r < N and 0 < signature.s < N and not point.is_identity
+    ]
+    s_inverses = batch_inverse_mod([items[i][2].s for i in candidates], N)
+
+    tables: Dict[AffinePoint, glv.GLVTables] = {}
+    for i, s_inv in zip(candidates, s_inverses):
+        point, z, signature = items[i]
+        u = (z * s_inv) % N
+        v = (signature.r * s_inv) % N
+
+        key = point._affine()
+        if key not in tables:
+            tables[key] = glv_tables(key)
+
+        terms = glv.precomputed_terms(u, generator_glv_tables())
+        terms += glv.precomputed_terms(v, tables[key])
+        results[i] = _has_x_coordinate(jacobian.multiply_multi(terms), signature.r)
+
+    return results
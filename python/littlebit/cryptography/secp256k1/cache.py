@@ -0,0 +1,259 @@
+import os
+import sys
+from collections import OrderedDict
+from hashlib import sha256
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from .constants import N
+
+
+class LRUCache:
+    """
+    Thread-safe, bounded mapping which evicts the least recently used entries, and
+    keeps count of its hits and misses.
+
+    A maxsize of 0 disables the cache: lookups always miss, and nothing is stored.
+    """
+
+    def __init__(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            try:
+                value = self._entries[key]
+            except KeyError:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            if not self.maxsize:
+                return
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            return self._entries.pop(key, None)
+
+    def resize(self, maxsize: int):
+        if maxsize < 0:
+            raise ValueError(f"maxsize must not be negative, got {maxsize}")
+
+        with self._lock:
+            self.maxsize = maxsize
+            while len(self._entries) > maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+        }
+
+
+class SignatureCache(LRUCache):
+    """
+    Bounded cache of successfully verified (public key, z, signature) triples, in the
+    style of the signature cache of Bitcoin Core. A signature seen once in the
+    mempool, and again in a block, is only verified the first time.
+
+    Entries are keyed by a salted SHA-256 of the SEC public key, the DER signature
+    and z. The salt is random, unless given, so that the keys can't be predicted to
+    target collisions or evictions. Only valid signatures are stored: a miss just
+    means that the signature must be verified.
+    """
+
+    def __init__(self, maxsize: int, salt: Optional[bytes] = None):
+        super().__init__(maxsize)
+        self._hasher = sha256(os.urandom(32) if salt is None else salt)
+
+    def key(self, point: Any, z: int, signature: Any) -> bytes:
+        hasher = self._hasher.copy()
+        # Verification only depends on z modulo N, which fits in 32 bytes. The SEC
+        # and DER encodings delimit themselves, so the fields can't run into each
+        # other.
+        hasher.update((z % N).to_bytes(32, "big"))
+        hasher.update(point.sec())
+        hasher.update(signature.der())
+        return hasher.digest()
+
+    def contains(self, point: Any, z: int, signature: Any) -> bool:
+        return self.get(self.key(point, z, signature)) is not None
+
+    def add(self, point: Any, z: int, signature: Any):
+        """
+        Stores a triple known to be valid, e.g. to pre-populate the cache.
+        """
+        self.put(self.key(point, z, signature), True)
+
+    def erase(self, point: Any, z: int, signature: Any) -> bool:
+        """
+        Removes a triple, e.g. once the block which contains it is connected, and
+        returns whether it was cached.
+        """
+        return self.pop(self.key(point, z, signature)) is not None
+
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def _deep_size(value: Any, seen: set) -> int:
+    # Approximate footprint of nested lists and tuples of ints, counting the objects
+    # shared between several containers only once.
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, (list, tuple)):
+        size += sum(_deep_size(item, seen) for item in value)
+    return size
+
+
+class TableCache:
+    """
+    Adaptive cache of precomputed tables for the keys that are used the most, under
+    a memory budget.
+
+    The first lookups of a key return None, and the caller falls back to its
+    regular code path. Once a key has been looked up `threshold` times, its table
+    is built, and returned by every later lookup. Tables are evicted, least recently
+    used first, when their total size exceeds max_bytes. A max_bytes of 0 disables
+    the cache.
+
+    All the tables of a cache are expected to have about the same size. Once a
+    table has turned out to be larger than the whole budget, no more tables are
+    built until the budget is raised: lookups return None, so that the caller keeps
+    to its regular code path rather than building a table which can't be kept.
+    """
+
+    def __init__(self, max_bytes: int, threshold: int = 3, tracked_keys: int = 4096):
+        """
+        tracked_keys: maximum number of keys, without a table yet, whose lookups are
+            counted. The least recently seen ones are forgotten first.
+        """
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+        if threshold < 1:
+            raise ValueError(f"threshold must be positive, got {threshold}")
+
+        self.max_bytes = max_bytes
+        self.threshold = threshold
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.builds = 0
+        self.evictions = 0
+        # Size of the last table built, to know whether the next one would fit
+        self._table_bytes = 0
+        self._tables: "OrderedDict[Hashable, Tuple[Any, int]]" = OrderedDict()
+        self._lookups = LRUCache(tracked_keys)
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._tables)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tables
+
+    def lookup(self, key: Hashable, build: Callable[[], Any]) -> Optional[Any]:
+        """
+        Returns the table of the key, building it with build() if the key just
+        became hot, or None if the key isn't hot yet.
+        """
+        with self._lock:
+            entry = self._tables.get(key)
+            if entry is not None:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return entry[0]
+
+            self.misses += 1
+            if self._table_bytes > self.max_bytes:
+                return None
+
+            lookups = (self._lookups.get(key) or 0) + 1
+            if lookups < self.threshold:
+                self._lookups.put(key, lookups)
+                return None
+            self._lookups.pop(key)
+
+        # Built without holding the lock, so that lookups of other keys don't wait
+        table = build()
+        size = _deep_size(table, set())
+        with self._lock:
+            self._table_bytes = size
+            if key not in self._tables and size <= self.max_bytes:
+                self._tables[key] = (table, size)
+                self.bytes += size
+                self.builds += 1
+                self._evict()
+        return table
+
+    def _evict(self):
+        while self.bytes > self.max_bytes:
+            _, (_, size) = self._tables.popitem(last=False)
+            self.bytes -= size
+            self.evictions += 1
+
+    def configure(self, max_bytes: int, threshold: Optional[int] = None):
+        if max_bytes < 0:
+            raise ValueError(f"max_bytes must not be negative, got {max_bytes}")
+        if threshold is not None and threshold < 1:
+            raise ValueError(f"threshold must be positive, got {threshold}")
+
+        with self._lock:
+            self.max_bytes = max_bytes
+            if threshold is not None:
+                self.threshold = threshold
+            self._evict()
+
+    def clear(self):
+        with self._lock:
+            self._tables.clear()
+            self._lookups.clear()
+            self._table_bytes = 0
+            self.bytes = self.hits = self.misses = self.builds = self.evictions = 0
+
+    def info(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "builds": self.builds,
+            "evictions": self.evictions,
+            "size": len(self._tables),
+            "bytes": self.bytes,
+            "max_bytes": self.max_bytes,
+            "threshold": self.threshold,
+        }
@@ -0,0 +1,117 @@
+"""
+Bulk derivation of public keys and addresses from private keys.
+
+Calling PrivateKey(secret).point.address() for every key does, for each of them,
+a scalar multiplication, a modular inversion to get back to affine coordinates,
+and the hashing. derive_addresses() streams through the secrets in chunks, and
+for each chunk:
+    1. computes the public keys in Jacobian coordinates, with the fixed-base
+       table of G, or with a single addition of G when a secret immediately
+       follows the previous one (sequential keys). With the "numpy" backend, the
+       fixed-base multiplications of the chunk are vectorized, see backend.py,
+    2. converts the whole chunk to affine coordinates with one inversion,
+    3. serializes, hashes, and encodes every address.
+
+Secrets are read one chunk at a time, so they can come from a generator of any
+length. In a single process, only one chunk is held in memory. With worker
+processes, at most 2 x processes chunks are submitted and not yet consumed at any
+time: results are yielded in order, and a new chunk is only submitted once the
+oldest one has been yielded.
+"""
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import Deque, Iterable, Iterator, List, Optional, Tuple
+
+from ..utils import encode_base58_checksum, hash160
+from . import backend, jacobian
+from .constants import Gx, Gy, N
+from .parallel import chunked
+from .point import multiply_generator
+
+# (secret, SEC public key, address)
+Derivation = Tuple[int, bytes, str]
+
+
+def _sec(x: int, y: int, compressed: bool) -> bytes:
+    # See S256Point.sec()
+    if compressed:
+        return (b"\x03" if y & 1 else b"\x02") + x.to_bytes(32, "big")
+    return b"\x04" + x.to_bytes(32, "big") + y.to_bytes(32, "big")
+
+
+def _multiply_generator_many(secrets: List[int]) -> List[jacobian.JacobianPoint]:
+    if backend.get_backend() == "numpy":
+        from . import vectorized
+
+        return vectorized.multiply_generator(secrets)
+    return [multiply_generator(secret) for secret in secrets]
+
+
+def derive_chunk(
+    secrets: List[int], compressed: bool = True, testnet: bool = False
+) -> List[Derivation]:
+    for secret in secrets:
+        if not 0 < secret < N:
+            raise ValueError(f"Secret {secret} not in range 1 to {N - 1}")
+
+    # Secrets which don't immediately follow the previous one need a full scalar
+    # multiplication. The others are computed as (k + 1)G = kG + G.
+    sequential = [
+        i > 0 and secret == secrets[i - 1] + 1 for i, secret in enumerate(secrets)
+    ]
+    products = iter(
+        _multiply_generator_many(
+            [secret for secret, follows in zip(secrets, sequential) if not follows]
+        )
+    )
+
+    points: List[jacobian.JacobianPoint] = []
+    for follows in sequential:
+        if follows:
+            points.append(jacobian.add_affine(points[-1], (Gx, Gy)))
+        else:
+            points.append(next(products))
+
+    prefix = b"\x6f" if testnet else b"\x00"
+    result = []
+    for secret, point in zip(secrets, jacobian.to_affine_batch(points)):
+        x, y = point  # type: ignore  # secrets are in range, so never infinity
+        sec = _sec(x, y, compressed)
+        result.append((secret, sec, encode_base58_checksum(prefix + hash160(sec))))
+    return result
+
+
+def _derive_chunk_star(args) -> List[Derivation]:
+    return derive_chunk(*args)
+
+
+def derive_addresses(
+    secrets: Iterable[int],
+    compressed: bool = True,
+    testnet: bool = False,
+    chunk_size: int = 256,
+    processes: Optional[int] = None,
+) -> Iterator[Derivation]:
+    """
+    Yields (secret, SEC public key, address) tuples, in the order of the secrets.
+
+    processes: if set, chunks are sharded across that many worker processes. At most
+        two chunks per worker are in flight at any time, so memory stays bounded.
+    """
+    chunks = chunked(secrets, chunk_size)
+    if not processes:
+        for chunk in chunks:
+            yield from derive_chunk(chunk, compressed, testnet)
+        return
+
+    with ProcessPoolExecutor(max_workers=processes) as executor:
+        pending: Deque = deque()
+        for chunk in chunks:
+            pending.append(
+                executor.submit(_derive_chunk_star, (chunk, compressed, testnet))
+            )
+            if len(pending) >= 2 * processes:
+                yield from pending.popleft().result()
+
+        while pending:
+            yield from pending.popleft().result()
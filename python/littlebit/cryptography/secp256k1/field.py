@@ -1,11 +1,163 @@
+from typing import Tuple
+
 from ..field import FieldElement
 from .constants import P
 
+###############################################################################
+# Arithmetic specialized for the secp256k1 prime                              #
+#                                                                             #
+# P is a pseudo-Mersenne prime:                                               #
+#     P = 2²⁵⁶ - C,  where C = 2³² + 977                                      #
+#                                                                             #
+# Hence 2²⁵⁶ ≡ C (mod P), and any number can be reduced by folding its high   #
+# bits back onto its low bits:                                                #
+#     hi x 2²⁵⁶ + lo ≡ hi x C + lo  (mod P)                                   #
+#                                                                             #
+# In CPython, the % operator and pow() run in C, and the folding below is     #
+# about as fast as a plain %, while the addition chains are on par with       #
+# pow(). Only inverse() is significantly faster than the generic code, so     #
+# it's the one used by S256FieldElement. The others are kept so that          #
+# benchmarks/field_arithmetic.py can keep comparing them, since the balance   #
+# differs between interpreters (PyPy, for example).                           #
+###############################################################################
+C = 2 ** 32 + 977
+MASK = 2 ** 256 - 1
+
+
+def reduce(number: int) -> int:
+    """
+    Reduces a number 0 <= n < 2⁵¹² modulo P, such as the product of two field
+    elements, using two folds and a conditional subtraction instead of a division.
+    """
+    number = (number & MASK) + (number >> 256) * C  # now < 2²⁹⁰
+    number = (number & MASK) + (number >> 256) * C  # now < 2P
+    return number - P if number >= P else number
+
+
+def mul(a: int, b: int) -> int:
+    return reduce(a * b)
+
+
+def square_n(number: int, n: int) -> int:
+    """
+    Computes number^(2ⁿ) modulo P, by squaring n times.
+    """
+    for _ in range(n):
+        number = reduce(number * number)
+    return number
+
+
+def _chain(number: int) -> Tuple[int, int, int]:
+    # Addition chain shared by inverse_chain() and sqrt(), taken from libsecp256k1.
+    # xₖ denotes number^(2ᵏ - 1), i.e. a run of k one bits in the exponent.
+    x2 = mul(square_n(number, 1), number)
+    x3 = mul(square_n(x2, 1), number)
+    x6 = mul(square_n(x3, 3), x3)
+    x9 = mul(square_n(x6, 3), x3)
+    x11 = mul(square_n(x9, 2), x2)
+    x22 = mul(square_n(x11, 11), x11)
+    x44 = mul(square_n(x22, 22), x22)
+    x88 = mul(square_n(x44, 44), x44)
+    x176 = mul(square_n(x88, 88), x88)
+    x220 = mul(square_n(x176, 44), x44)
+    x223 = mul(square_n(x220, 3), x3)
+    return x2, x22, x223
+
+
+def inverse_chain(number: int) -> int:
+    """
+    Computes number^(P - 2) = 1 / number, with 255 squarings and 15
+    multiplications, instead of the ~380 operations of a generic exponentiation.
+    """
+    x2, x22, x223 = _chain(number)
+    result = mul(square_n(x223, 23), x22)
+    result = mul(square_n(result, 5), number)
+    result = mul(square_n(result, 3), x2)
+    return mul(square_n(result, 2), number)
+
+
+def inverse(number: int) -> int:
+    """
+    Modular inverse of a number modulo P.
+
+    In CPython, pow() with a -1 exponent runs the extended Euclidean algorithm in
+    C, which is several times faster than any exponentiation done in Python,
+    including inverse_chain(). See benchmarks/field_arithmetic.py.
+    """
+    if not number % P:
+        raise ZeroDivisionError("Cannot invert zero")
+    return pow(number, -1, P)
+
+
+def sqrt(number: int) -> int:
+    """
+    Computes number^((P + 1) / 4), which is a square root of the number, if it has
+    one. See S256FieldElement.sqrt() for details.
+    """
+    x2, x22, x223 = _chain(number)
+    result = mul(square_n(x223, 23), x22)
+    result = mul(square_n(result, 6), x2)
+    return square_n(result, 2)
+
 
 class S256FieldElement(FieldElement):
+    __slots__ = ()
+
     def __init__(self, number, prime=None):
         super().__init__(number=number, prime=P)
 
+    @classmethod
+    def _unchecked(cls, number: int) -> "S256FieldElement":
+        """
+        Internal constructor for numbers that are already known to be in the range
+        0 to P - 1, such as the results of arithmetic modulo P. It skips the range
+        validation done by the public constructor.
+        """
+        element = object.__new__(cls)
+        element.number = number
+        element.prime = P
+        return element
+
+    ###############################################################################
+    # Fast path for arithmetic between two S256FieldElement instances.            #
+    #                                                                             #
+    # Every S256FieldElement lives in the field of order P, so there is no need   #
+    # to compare the primes of both operands, and the result of a modular         #
+    # operation doesn't need its range validated again. Anything else, such as a  #
+    # generic FieldElement operand, goes through the checked FieldElement path.   #
+    ###############################################################################
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, S256FieldElement):
+            return self.number == other.number
+        return super().__eq__(other)
+
+    def __add__(self, other: FieldElement) -> FieldElement:
+        if isinstance(other, S256FieldElement):
+            return self._unchecked((self.number + other.number) % P)
+        return super().__add__(other)
+
+    def __sub__(self, other: FieldElement) -> FieldElement:
+        if isinstance(other, S256FieldElement):
+            return self._unchecked((self.number - other.number) % P)
+        return super().__sub__(other)
+
+    def __mul__(self, other: FieldElement) -> FieldElement:
+        if isinstance(other, S256FieldElement):
+            return self._unchecked((self.number * other.number) % P)
+        return super().__mul__(other)
+
+    def __pow__(self, exponent: int) -> FieldElement:
+        return self._unchecked(pow(self.number, exponent, P))
+
+    def __truediv__(self, other: FieldElement) -> FieldElement:
+        if isinstance(other, S256FieldElement):
+            return self._unchecked((self.number * inverse(other.number)) % P)
+        return super().__truediv__(other)
+
+    def __rmul__(self, coefficient: int) -> FieldElement:
+        return self._unchecked((self.number * coefficient) % P)
+
     def sqrt(self):
         ###############################################################################
         # Lemma 1: the prime p used in secp256k1 is such that p % 4 == 3              #
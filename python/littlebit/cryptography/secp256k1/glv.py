@@ -0,0 +1,92 @@
+"""
+Gallant-Lambert-Vanstone (GLV) scalar decomposition for secp256k1.
+
+Since β³ = 1 (mod P), the map φ(x, y) = (β * x, y) sends every point of the curve
+back to the curve, and it turns out that φ(Q) = λ * Q for all points Q. Computing
+φ(Q) costs a single field multiplication, instead of a full scalar multiplication.
+
+Any scalar k can be split as k = k₁ + k₂λ (mod N), where k₁ and k₂ are only about
+128 bits long. Then:
+    kQ = k₁Q + k₂φ(Q)
+
+which is a multi-scalar multiplication with half-length scalars, and needs only
+half as many doublings.
+"""
+from typing import List, Tuple
+
+from .constants import BETA, N, P
+from .jacobian import AffinePoint
+
+# Short basis of the lattice {(a, b) : a + bλ = 0 (mod N)}, taken from the Guide to
+# Elliptic Curve Cryptography (Hankerson, Menezes, Vanstone), section 3.5.
+A1 = 0x3086D221A7D46BCDE86C90E49284EB15
+B1 = -0xE4437ED6010E88286F547FA90ABFE4C3
+A2 = 0x114CA50F7A8E2F3F657C1108D9D44CFD8
+B2 = A1
+
+
+def split_scalar(coefficient: int) -> Tuple[int, int]:
+    """
+    Returns (k₁, k₂) such that k₁ + k₂λ = k (mod N), where |k₁| and |k₂| are at
+    most 129 bits long. Both halves may be negative.
+    """
+    k = coefficient % N
+
+    # Round (b₂k / N) and (-b₁k / N) to the nearest integer
+    c1 = (B2 * k + N // 2) // N
+    c2 = (-B1 * k + N // 2) // N
+
+    k1 = k - c1 * A1 - c2 * A2
+    k2 = -c1 * B1 - c2 * B2
+    return k1, k2
+
+
+def negate(table: List[AffinePoint]) -> List[AffinePoint]:
+    return [(x, P - y) for x, y in table]
+
+
+def endomorphism(table: List[AffinePoint]) -> List[AffinePoint]:
+    """
+    Applies φ(x, y) = (β * x, y) to every point of a table. Since φ is a group
+    homomorphism, the odd multiples of Q become the odd multiples of φ(Q).
+    """
+    return [((BETA * x) % P, y) for x, y in table]
+
+
+def terms(
+    coefficient: int, table: List[AffinePoint]
+) -> List[Tuple[int, List[AffinePoint]]]:
+    """
+    Splits kQ into the two terms k₁Q + k₂φ(Q), given the odd multiples of Q,
+    ready to be fed into a multi-scalar multiplication. Negative halves are
+    handled by negating the corresponding table.
+    """
+    k1, k2 = split_scalar(coefficient)
+    table_1 = table if k1 >= 0 else negate(table)
+    table_2 = endomorphism(table if k2 >= 0 else negate(table))
+    return [(abs(k1), table_1), (abs(k2), table_2)]
+
+
+# The odd multiples of Q, -Q, φ(Q) and φ(-Q)
+GLVTables = Tuple[
+    List[AffinePoint], List[AffinePoint], List[AffinePoint], List[AffinePoint]
+]
+
+
+def precompute(table: List[AffinePoint]) -> GLVTables:
+    """
+    Computes all the tables that terms() may need for a point at once, so that
+    points used many times, such as G, don't pay for them on every multiplication.
+    """
+    negated = negate(table)
+    return table, negated, endomorphism(table), endomorphism(negated)
+
+
+def precomputed_terms(
+    coefficient: int, tables: GLVTables
+) -> List[Tuple[int, List[AffinePoint]]]:
+    """
+    Same as terms(), with the tables returned by precompute().
+    """
+    k1, k2 = split_scalar(coefficient)
+    return [(abs(k1), tables[k1 < 0]), (abs(k2), tables[2 + (k2 < 0)])]
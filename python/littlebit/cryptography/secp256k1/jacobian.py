@@ -0,0 +1,298 @@
+"""
+Jacobian-coordinate point arithmetic on secp256k1.
+
+An affine point (x, y) is represented by the triple (X, Y, Z) such that
+x = X / Z² and y = Y / Z³. Working in this representation lets us add and double
+points without doing a field division at every step: the only modular inversion
+happens when the final result is converted back to affine coordinates.
+
+The functions below operate on plain integers modulo P, instead of
+S256FieldElement instances, since they sit on the hot path of every scalar
+multiplication. They are internal helpers for S256Point, and are not meant to be
+used directly.
+"""
+from typing import List, Optional, Sequence, Tuple, cast
+
+from ..field import batch_inverse_mod
+from .constants import P
+
+AffinePoint = Tuple[int, int]
+JacobianPoint = Tuple[int, int, int]
+
+# The point at infinity is any triple with Z = 0.
+INFINITY: JacobianPoint = (0, 1, 0)
+
+
+def to_jacobian(point: AffinePoint) -> JacobianPoint:
+    x, y = point
+    return x, y, 1
+
+
+def to_affine(point: JacobianPoint) -> Optional[AffinePoint]:
+    """
+    Converts a point from Jacobian to affine coordinates, using a single modular
+    inversion. Returns None for the point at infinity.
+    """
+    X, Y, Z = point
+    if not Z:
+        return None
+
+    # pow() with a negative exponent (Python 3.8+) computes the modular inverse with
+    # the extended Euclidean algorithm, which is a lot faster than the Fermat's
+    # Little Theorem approach of raising Z to the power p-2.
+    z_inv = pow(Z, -1, P)
+    z_inv_2 = (z_inv * z_inv) % P
+    return (X * z_inv_2) % P, (Y * z_inv_2 * z_inv) % P
+
+
+def to_affine_batch(points: Sequence[JacobianPoint]) -> List[Optional[AffinePoint]]:
+    """
+    Converts many points from Jacobian to affine coordinates, sharing a single
+    modular inversion between all of them. Points at infinity are returned as None.
+    """
+    finite = [i for i, point in enumerate(points) if point[2]]
+    z_inverses = batch_inverse_mod([points[i][2] for i in finite], P)
+
+    result: List[Optional[AffinePoint]] = [None] * len(points)
+    for i, z_inv in zip(finite, z_inverses):
+        X, Y, _ = points[i]
+        z_inv_2 = (z_inv * z_inv) % P
+        result[i] = (X * z_inv_2) % P, (Y * z_inv_2 * z_inv) % P
+    return result
+
+
+def double(point: JacobianPoint) -> JacobianPoint:
+    ###############################################################################
+    # Point Doubling in Jacobian coordinates, for a = 0  (dbl-2009-l)             #
+    #                                                                             #
+    # Formula:                                                                    #
+    #     A = X₁²,  B = Y₁²,  C = B²                                              #
+    #     D = 2((X₁ + B)² - A - C)                                                #
+    #     E = 3A,   F = E²                                                        #
+    #     X₃ = F - 2D                                                             #
+    #     Y₃ = E(D - X₃) - 8C                                                     #
+    #     Z₃ = 2Y₁Z₁                                                              #
+    ###############################################################################
+    X1, Y1, Z1 = point
+    if not Z1 or not Y1:
+        return INFINITY
+
+    A = (X1 * X1) % P
+    B = (Y1 * Y1) % P
+    C = (B * B) % P
+    D = (2 * ((X1 + B) * (X1 + B) - A - C)) % P
+    E = 3 * A
+    F = (E * E) % P
+
+    X3 = (F - 2 * D) % P
+    Y3 = (E * (D - X3) - 8 * C) % P
+    Z3 = (2 * Y1 * Z1) % P
+    return X3, Y3, Z3
+
+
+def add(p: JacobianPoint, q: JacobianPoint) -> JacobianPoint:
+    ###############################################################################
+    # Point Addition in Jacobian coordinates  (add-2007-bl, without the Z-trick)  #
+    #                                                                             #
+    # Formula:                                                                    #
+    #     U₁ = X₁Z₂²,  U₂ = X₂Z₁²                                                 #
+    #     S₁ = Y₁Z₂³,  S₂ = Y₂Z₁³                                                 #
+    #     H = U₂ - U₁,  R = S₂ - S₁                                               #
+    #     X₃ = R² - H³ - 2U₁H²                                                    #
+    #     Y₃ = R(U₁H² - X₃) - S₁H³                                                #
+    #     Z₃ = HZ₁Z₂                                                              #
+    ###############################################################################
+    X1, Y1, Z1 = p
+    X2, Y2, Z2 = q
+    if not Z1:
+        return q
+    if not Z2:
+        return p
+
+    Z1Z1 = (Z1 * Z1) % P
+    Z2Z2 = (Z2 * Z2) % P
+    U1 = (X1 * Z2Z2) % P
+    U2 = (X2 * Z1Z1) % P
+    S1 = (Y1 * Z2 * Z2Z2) % P
+    S2 = (Y2 * Z1 * Z1Z1) % P
+
+    H = (U2 - U1) % P
+    R = (S2 - S1) % P
+    if not H:
+        # Same x coordinate: either P + P (tangent), or P + (-P) = I
+        return double(p) if not R else INFINITY
+
+    HH = (H * H) % P
+    HHH = (H * HH) % P
+    V = (U1 * HH) % P
+
+    X3 = (R * R - HHH - 2 * V) % P
+    Y3 = (R * (V - X3) - S1 * HHH) % P
+    Z3 = (Z1 * Z2 * H) % P
+    return X3, Y3, Z3
+
+
+def add_affine(p: JacobianPoint, q: AffinePoint) -> JacobianPoint:
+    """
+    Mixed addition of a Jacobian point p and an affine point q, which is the same
+    as add() with Z₂ = 1, and saves a handful of multiplications.
+    """
+    X1, Y1, Z1 = p
+    x2, y2 = q
+    if not Z1:
+        return x2, y2, 1
+
+    Z1Z1 = (Z1 * Z1) % P
+    U2 = (x2 * Z1Z1) % P
+    S2 = (y2 * Z1 * Z1Z1) % P
+
+    H = (U2 - X1) % P
+    R = (S2 - Y1) % P
+    if not H:
+        return double(p) if not R else INFINITY
+
+    HH = (H * H) % P
+    HHH = (H * HH) % P
+    V = (X1 * HH) % P
+
+    X3 = (R * R - HHH - 2 * V) % P
+    Y3 = (R * (V - X3) - Y1 * HHH) % P
+    Z3 = (Z1 * H) % P
+    return X3, Y3, Z3
+
+
+def multiply(point: AffinePoint, coefficient: int) -> JacobianPoint:
+    """
+    Left-to-right double-and-add scalar multiplication. The base point is kept in
+    affine coordinates, so that every addition is a cheaper mixed addition.
+    """
+    result = INFINITY
+    for bit in bin(coefficient)[2:]:
+        result = double(result)
+        if bit == "1":
+            result = add_affine(result, point)
+    return result
+
+
+# A fixed-base table is a list of rows, where row i holds the affine points
+# j * 2ʷⁱ * B for j = 1 .. 2ʷ - 1, and B is the base point.
+FixedBaseTable = List[List[AffinePoint]]
+
+
+def build_fixed_base_table(point: AffinePoint, window: int = 4) -> FixedBaseTable:
+    """
+    Precomputes the multiples of a fixed base point, such that any scalar
+    multiplication by that point can later be done with additions only.
+    """
+    rows = []
+    base = to_jacobian(point)
+    for _ in range(-(-256 // window)):
+        row = []
+        current = base
+        for _ in range((1 << window) - 1):
+            row.append(current)
+            current = add(current, base)
+
+        rows.append(row)
+        base = current  # 2ʷ * base
+
+    size = len(rows[0])
+    points = cast(List[AffinePoint], to_affine_batch([p for row in rows for p in row]))
+    return [points[i : i + size] for i in range(0, len(points), size)]
+
+
+def multiply_fixed_base(
+    table: FixedBaseTable, coefficient: int, window: int = 4
+) -> JacobianPoint:
+    ###############################################################################
+    # Fixed-base windowed multiplication                                          #
+    #                                                                             #
+    # Write the scalar in base 2ʷ:                                                #
+    #     k = Σ dᵢ2ʷⁱ,  where 0 ≤ dᵢ < 2ʷ                                         #
+    # Then:                                                                       #
+    #     kB = Σ dᵢ(2ʷⁱB) = Σ table[i][dᵢ - 1]                                    #
+    #                                                                             #
+    # Each non-zero digit costs a single mixed addition, and no doubling at all.  #
+    ###############################################################################
+    mask = (1 << window) - 1
+    result = INFINITY
+    for row in table:
+        if not coefficient:
+            break
+
+        digit = coefficient & mask
+        if digit:
+            result = add_affine(result, row[digit - 1])
+        coefficient >>= window
+    return result
+
+
+def wnaf(coefficient: int, width: int) -> List[int]:
+    """
+    Returns the width-w Non-Adjacent Form of a positive scalar, least significant
+    digit first. Every non-zero digit is odd, lies strictly between -2ʷ⁻¹ and 2ʷ⁻¹,
+    and is followed by at least w - 1 zeros.
+    """
+    digits = []
+    full, half = 1 << width, 1 << (width - 1)
+    while coefficient:
+        if coefficient & 1:
+            digit = coefficient & (full - 1)
+            if digit >= half:
+                digit -= full
+            coefficient -= digit
+        else:
+            digit = 0
+
+        digits.append(digit)
+        coefficient >>= 1
+    return digits
+
+
+def odd_multiples(point: AffinePoint, width: int) -> List[AffinePoint]:
+    """
+    Returns [P, 3P, 5P, ..., (2ʷ⁻¹ - 1)P], which are all the multiples needed to
+    process the digits of a width-w NAF.
+    """
+    base = to_jacobian(point)
+    twice = double(base)
+
+    multiples = [base]
+    for _ in range((1 << (width - 2)) - 1):
+        multiples.append(add(multiples[-1], twice))
+    return cast(List[AffinePoint], to_affine_batch(multiples))
+
+
+def multiply_multi(terms: Sequence[Tuple[int, Sequence[AffinePoint]]]) -> JacobianPoint:
+    ###############################################################################
+    # Interleaved wNAF multi-scalar multiplication  (Straus-Shamir trick)         #
+    #                                                                             #
+    # Formula:                                                                    #
+    #     k₁P₁ + k₂P₂ + ... + kₙPₙ                                                #
+    #                                                                             #
+    # Instead of computing every kᵢPᵢ separately and adding the results, all the  #
+    # scalars are scanned together from the most significant digit, so that the   #
+    # doubling chain is shared: 256 doublings in total, instead of 256 per term.  #
+    #                                                                             #
+    # Each term is a (scalar, odd multiples of Pᵢ) pair. The width of the wNAF    #
+    # used for the scalar is deduced from the size of the table of odd multiples. #
+    ###############################################################################
+    expansions = [
+        (wnaf(coefficient, len(table).bit_length() + 1), table)
+        for coefficient, table in terms
+    ]
+
+    result = INFINITY
+    for i in reversed(range(max((len(digits) for digits, _ in expansions), default=0))):
+        result = double(result)
+        for digits, table in expansions:
+            if i >= len(digits) or not digits[i]:
+                continue
+
+            digit = digits[i]
+            if digit > 0:
+                result = add_affine(result, table[digit >> 1])
+            else:
+                x, y = table[-digit >> 1]
+                result = add_affine(result, (x, P - y))
+    return result
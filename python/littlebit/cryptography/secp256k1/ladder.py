@@ -0,0 +1,121 @@
+"""
+Montgomery ladder scalar multiplication with complete addition formulas.
+
+The default scalar multiplication skips work depending on the bits of the scalar
+(zero digits of the wNAF, zero windows of the fixed-base table), which leaks
+information about secret scalars, such as the nonce k used for signing, through
+timing. The ladder below runs the exact same sequence of field operations for
+every scalar:
+    - the scalar is always processed as 257 bits, see multiply(),
+    - every step does one addition and one doubling,
+    - both use the same complete formula, which has no special case for the
+      point at infinity or for doubling,
+    - the choice between the two ladder registers is a conditional swap done
+      with arithmetic masks, instead of a branch.
+
+CPython big integers don't run in constant time themselves, so this is about
+removing the obvious data-dependent branches, not a guarantee against all
+side-channels.
+
+Points are represented in homogeneous projective coordinates (X : Y : Z), where
+x = X / Z and y = Y / Z. The point at infinity is (0 : 1 : 0).
+"""
+from secrets import randbelow
+from typing import Optional, Tuple
+
+from .constants import B, N, P
+from .jacobian import AffinePoint
+
+ProjectivePoint = Tuple[int, int, int]
+
+B3 = 3 * B
+
+
+def complete_add(p: ProjectivePoint, q: ProjectivePoint) -> ProjectivePoint:
+    ###############################################################################
+    # Complete addition for short Weierstrass curves with a = 0                   #
+    #                                                                             #
+    # Algorithm 7 of "Complete addition formulas for prime order elliptic curves" #
+    # (Renes, Costello, Batina - 2016). It is valid for all inputs, including     #
+    # P + P, P + (-P) and the point at infinity, with 12 multiplications and 2    #
+    # multiplications by the constant 3b.                                         #
+    ###############################################################################
+    X1, Y1, Z1 = p
+    X2, Y2, Z2 = q
+
+    t0 = (X1 * X2) % P
+    t1 = (Y1 * Y2) % P
+    t2 = (Z1 * Z2) % P
+    t3 = ((X1 + Y1) * (X2 + Y2) - t0 - t1) % P
+    t4 = ((Y1 + Z1) * (Y2 + Z2) - t1 - t2) % P
+    Y3 = ((X1 + Z1) * (X2 + Z2) - t0 - t2) % P
+
+    t0 = 3 * t0
+    t2 = B3 * t2
+    Z3 = t1 + t2
+    t1 = t1 - t2
+    Y3 = (B3 * Y3) % P
+
+    X3 = (t3 * t1 - t4 * Y3) % P
+    Y3 = (t1 * Z3 + Y3 * t0) % P
+    Z3 = (Z3 * t4 + t0 * t3) % P
+    return X3, Y3, Z3
+
+
+def _conditional_swap(
+    swap: int, p: ProjectivePoint, q: ProjectivePoint
+) -> Tuple[ProjectivePoint, ProjectivePoint]:
+    # mask is 0 (keep) or -1, i.e. all bits set (swap)
+    mask = -swap
+    X = (p[0] ^ q[0]) & mask
+    Y = (p[1] ^ q[1]) & mask
+    Z = (p[2] ^ q[2]) & mask
+    return (p[0] ^ X, p[1] ^ Y, p[2] ^ Z), (q[0] ^ X, q[1] ^ Y, q[2] ^ Z)
+
+
+def multiply(point: AffinePoint, coefficient: int) -> ProjectivePoint:
+    ###############################################################################
+    # Montgomery ladder                                                           #
+    #                                                                             #
+    # Invariant: R₁ - R₀ = P                                                      #
+    #                                                                             #
+    # For each bit of k, from the most significant one:                           #
+    #     bit = 0:  R₁ = R₀ + R₁,  R₀ = 2R₀                                       #
+    #     bit = 1:  R₀ = R₀ + R₁,  R₁ = 2R₁                                       #
+    #                                                                             #
+    # Both cases are the same computation, after swapping R₀ and R₁.              #
+    ###############################################################################
+
+    # Since NP = I, adding N or 2N to k doesn't change kP. We pick the one which has
+    # exactly 257 bits, so that every scalar has the same length, and the ladder
+    # starts from R₀ = P and R₁ = 2P instead of the point at infinity, whose
+    # coordinates are small numbers that CPython multiplies faster.
+    k = coefficient % N + N
+    k += N * (1 - (k >> 256))
+
+    # Randomize the projective representation, so that intermediate values don't
+    # depend only on the scalar: (X : Y : Z) = (λx : λy : λ) for a random λ.
+    blind = randbelow(P - 1) + 1
+    r0: ProjectivePoint = ((point[0] * blind) % P, (point[1] * blind) % P, blind)
+    r1 = complete_add(r0, r0)
+
+    swap = 0
+    for i in reversed(range(256)):
+        bit = (k >> i) & 1
+        r0, r1 = _conditional_swap(swap ^ bit, r0, r1)
+        swap = bit
+
+        r1 = complete_add(r0, r1)
+        r0 = complete_add(r0, r0)
+
+    r0, r1 = _conditional_swap(swap, r0, r1)
+    return r0
+
+
+def to_affine(point: ProjectivePoint) -> Optional[AffinePoint]:
+    X, Y, Z = point
+    if not Z:
+        return None
+
+    z_inv = pow(Z, -1, P)
+    return (X * z_inv) % P, (Y * z_inv) % P
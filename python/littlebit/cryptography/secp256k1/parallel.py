@@ -0,0 +1,131 @@
+"""
+Signing and verification of large batches across several processes.
+
+Python threads can't run the pure Python arithmetic of this package in parallel,
+because of the GIL, so the work is sharded across a pool of worker processes
+instead. Inputs and outputs are exchanged in their compact serialized forms:
+    - public keys as SEC bytes,
+    - signatures as DER bytes,
+    - secrets and message hashes (z) as 32-byte big-endian integers,
+which are a lot cheaper to pickle, and to send to another process, than the
+S256Point, Signature and PrivateKey dataclasses.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, TypeVar
+
+from .batch import verify_batch
+from .point import S256Point
+from .private_key import PrivateKey
+from .signature import Signature
+
+T = TypeVar("T")
+
+# (SEC public key, DER signature, 32-byte z)
+VerifyItem = Tuple[bytes, bytes, bytes]
+# (32-byte secret, 32-byte z)
+SignItem = Tuple[bytes, bytes]
+
+
+def chunked(items: Iterable[T], size: int) -> Iterator[List[T]]:
+    """
+    Lazily splits an iterable into lists of the given size, the last one possibly
+    shorter.
+    """
+    chunk: List[T] = []
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def verify_chunk(chunk: Sequence[VerifyItem]) -> List[bool]:
+    """
+    Verifies serialized (sec, der, z) triples. Entries that can't be parsed are
+    reported as invalid, instead of failing the whole chunk.
+    """
+    results = [False] * len(chunk)
+    parsed, indices = [], []
+    for i, (sec, der, z) in enumerate(chunk):
+        try:
+            item = (
+                S256Point.parse(sec),
+                int.from_bytes(z, "big"),
+                Signature.parse(der),
+            )
+        except (ValueError, IndexError):
+            continue
+
+        parsed.append(item)
+        indices.append(i)
+
+    for i, result in zip(indices, verify_batch(parsed)):
+        results[i] = result
+    return results
+
+
+def sign_chunk(chunk: Sequence[SignItem]) -> List[bytes]:
+    """
+    Signs serialized (secret, z) pairs, and returns DER signatures.
+    """
+    return [
+        PrivateKey(int.from_bytes(secret, "big")).sign(int.from_bytes(z, "big")).der()
+        for secret, z in chunk
+    ]
+
+
+class _ParallelExecutor:
+    def __init__(self, max_workers: Optional[int] = None, chunk_size: int = 64):
+        """
+        max_workers: number of worker processes, defaults to the number of CPUs.
+        chunk_size: number of items sent to a worker at once. Larger chunks amortize
+            the inter-process communication, smaller ones balance the load better.
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be positive, got {chunk_size}")
+
+        self.chunk_size = chunk_size
+        self._executor = ProcessPoolExecutor(max_workers=max_workers)
+
+    def _map(self, function, items: Iterable) -> list:
+        # executor.map() yields results in the order of the chunks, so flattening
+        # them keeps the results in the order of the inputs.
+        results: list = []
+        for chunk_results in self._executor.map(
+            function, chunked(items, self.chunk_size)
+        ):
+            results += chunk_results
+        return results
+
+    def close(self):
+        self._executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ParallelVerifier(_ParallelExecutor):
+    """
+    Usage:
+        with ParallelVerifier(max_workers=4) as verifier:
+            results = verifier.verify([(sec, der, z), ...])
+    """
+
+    def verify(self, items: Iterable[VerifyItem]) -> List[bool]:
+        return self._map(verify_chunk, items)
+
+
+class ParallelSigner(_ParallelExecutor):
+    """
+    Usage:
+        with ParallelSigner(max_workers=4) as signer:
+            signatures = signer.sign([(secret, z), ...])
+    """
+
+    def sign(self, items: Iterable[SignItem]) -> List[bytes]:
+        return self._map(sign_chunk, items)
@@ -1,32 +1,235 @@
-from typing import cast
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, cast
 
+from ..curve import Curve
 from ..point import Point
 from ..utils import encode_base58_checksum, hash160
 from .constants import A, B, Gx, Gy, N, P
 from .field import S256FieldElement
 from .signature import Signature
 
+# The arithmetic kernels and the caches are imported on first use, so that importing
+# this module stays cheap for short-lived processes, such as the workers of
+# parallel.py and derive.py. See tests/cryptography/test_import_time.py.
+if TYPE_CHECKING:
+    from . import glv
+    from .cache import LRUCache, SignatureCache, TableCache
+    from .jacobian import AffinePoint, FixedBaseTable, JacobianPoint
+
+# Width of the wNAF used for variable-base scalars, and for multiples of G in
+# multi-scalar multiplications. The odd multiples of G are computed only once, so
+# we can afford a much wider window for it.
+WINDOW = 5
+GENERATOR_WINDOW = 8
+# Width of the wNAF for the keys which have their tables cached, see glv_tables()
+HOT_KEY_WINDOW = 7
+
+# When enabled, every S256Point scalar multiplication uses the Montgomery ladder
+# instead of the faster, but branchy, wNAF and fixed-base table code paths. This
+# covers the multiplication by the secret nonce in PrivateKey.sign. See ladder.py
+# and benchmarks/timing_variance.py for the cost of the hardening.
+CONSTANT_TIME = False
+
+
+@lru_cache(maxsize=None)
+def generator_table() -> "FixedBaseTable":
+    """
+    Precomputed multiples of the generator point G, built on first use.
+    """
+    from . import jacobian
+
+    return jacobian.build_fixed_base_table((Gx, Gy))
+
+
+def multiply_generator(coefficient: int) -> "JacobianPoint":
+    from . import jacobian
+
+    return jacobian.multiply_fixed_base(generator_table(), coefficient)
+
+
+@lru_cache(maxsize=None)
+def generator_odd_multiples() -> List["AffinePoint"]:
+    from . import jacobian
+
+    return jacobian.odd_multiples((Gx, Gy), GENERATOR_WINDOW)
+
+
+@lru_cache(maxsize=None)
+def generator_glv_tables() -> "glv.GLVTables":
+    from . import glv
+
+    return glv.precompute(generator_odd_multiples())
+
+
+def glv_tables(point: "AffinePoint") -> "glv.GLVTables":
+    """
+    Tables of odd multiples of a point, for GLV multi-scalar multiplications:
+        - G has wide tables, computed only once,
+        - hot keys, which are used over and over, get wide tables cached by
+          key_tables(), if enabled, see configure_key_tables(),
+        - any other point gets narrow tables, computed on the fly.
+    """
+    from . import glv, jacobian
+
+    if point == (Gx, Gy):
+        return generator_glv_tables()
+
+    if key_tables().max_bytes:
+        tables = key_tables().lookup(
+            point,
+            lambda: glv.precompute(jacobian.odd_multiples(point, HOT_KEY_WINDOW)),
+        )
+        if tables is not None:
+            return tables
+
+    return glv.precompute(jacobian.odd_multiples(point, WINDOW))
+
+
+def _generator() -> "S256Point":
+    # generator() is defined at the end of the module, after S256Point
+    return generator()
+
+
+# The curve shared by every S256Point. G is built on first use, see generator().
+SECP256K1 = Curve.of(
+    S256FieldElement(A), S256FieldElement(B), n=N, generator=_generator
+)
+
 
 class S256Point(Point):
     def __init__(self, x, y, a=None, b=None):
-        a, b = S256FieldElement(A), S256FieldElement(B)
-
+        # a and b are ignored, the curve is always secp256k1
         if isinstance(x, int) and isinstance(y, int):
-            super().__init__(x=S256FieldElement(x), y=S256FieldElement(y), a=a, b=b)
+            super().__init__(
+                x=S256FieldElement(x), y=S256FieldElement(y), curve=SECP256K1
+            )
         else:
             # x and y are either both None, or both instances of S256FieldElement
-            super().__init__(x=x, y=y, a=a, b=b)
+            super().__init__(x=x, y=y, curve=SECP256K1)
+
+    @classmethod
+    def _from_affine(cls, point: Optional["AffinePoint"]) -> "S256Point":
+        if point is None:
+            return cls._unchecked(None, None, SECP256K1)
+
+        # The coordinates come out of arithmetic modulo P on valid points, so they
+        # are in the field range, and on the curve.
+        x, y = point
+        return cls._unchecked(
+            S256FieldElement._unchecked(x), S256FieldElement._unchecked(y), SECP256K1
+        )
+
+    def _affine(self) -> "AffinePoint":
+        return self.x.number, self.y.number
+
+    def _glv_tables(self) -> "glv.GLVTables":
+        return glv_tables(self._affine())
 
     def __rmul__(self, coefficient):
-        return super().__rmul__(coefficient % N)
+        # The generic Point.__rmul__ does a field division for every addition and
+        # doubling. Here, the whole double-and-add loop runs in Jacobian
+        # coordinates, and we convert back to affine only once at the end.
+        from . import glv, jacobian
+
+        if CONSTANT_TIME:
+            return self.ladder_mul(coefficient)
+
+        coef = coefficient % N
+        if self.is_identity or not coef:
+            return self._from_affine(None)
+
+        if self._affine() == (Gx, Gy):
+            total = multiply_generator(coef)
+        else:
+            total = jacobian.multiply_multi(
+                glv.precomputed_terms(coef, self._glv_tables())
+            )
+        return self._from_affine(jacobian.to_affine(total))
+
+    def ladder_mul(self, coefficient: int) -> "S256Point":
+        """
+        Scalar multiplication with a fixed sequence of field operations, whatever
+        the value of the scalar. Use it for secret scalars.
+        """
+        # Imported here, as it is only needed by hardened code paths, and its
+        # dependency on the secrets module is slow to import.
+        from . import ladder
+
+        if self.is_identity:
+            return self._from_affine(None)
+
+        total = ladder.multiply(self._affine(), coefficient % N)
+        return self._from_affine(ladder.to_affine(total))
+
+    def dual_mul(self, u: int, other: "S256Point", v: int) -> "S256Point":
+        """
+        Returns u * self + v * other.
+
+        Both scalar multiplications are interleaved, so that they share the same
+        chain of doublings. This is roughly twice as fast as computing u * self and
+        v * other separately. Each scalar is further split in two halves using the
+        GLV endomorphism, which halves the length of the doubling chain again.
+        """
+        from . import glv, jacobian
+
+        terms = []
+        for coefficient, point in ((u, self), (v, other)):
+            if coefficient % N and not point.is_identity:
+                terms += glv.precomputed_terms(coefficient, point._glv_tables())
+        return self._from_affine(jacobian.to_affine(jacobian.multiply_multi(terms)))
 
     def verify(self, z: int, signature: Signature) -> bool:
-        s_inv = pow(signature.s, N - 2, N)
+        """
+        Checks the signature of z. Successful verifications are remembered by the
+        signature cache, if enabled, see configure_signature_cache().
+        """
+        # The point at infinity is not a valid public key: u * G + v * I = u * G
+        # would let anyone forge a signature for it.
+        if self.is_identity or not (0 < signature.r < N and 0 < signature.s < N):
+            return False
+
+        cache = signature_cache()
+        if not cache.maxsize:
+            return self._verify(z, signature)
+
+        key = cache.key(self, z, signature)
+        if cache.get(key):
+            return True
+
+        valid = self._verify(z, signature)
+        if valid:
+            cache.put(key, True)
+        return valid
+
+    def _verify(self, z: int, signature: Signature) -> bool:
+        # Same as pow(s, N - 2, N), but much faster. See field.inverse()
+        s_inv = pow(signature.s, -1, N)
         u = (z * s_inv) % N
         v = (signature.r * s_inv) % N
 
-        total = u * G + v * self
-        return total.x.number == signature.r
+        total = generator().dual_mul(u, self, v)
+        # r is the x coordinate of the total reduced modulo N, see verify_batch()
+        return not total.is_identity and total.x.number % N == signature.r
+
+    def __setattr__(self, name, value):
+        # Points are mutable. Encodings are derived from the coordinates, so they must
+        # be computed again if a coordinate is ever replaced. Module-level caches,
+        # such as the parse cache, never hand out instances for the same reason.
+        if name in ("x", "y"):
+            self.__dict__.pop("_cache", None)
+        super().__setattr__(name, value)
+
+    def _cached(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        """
+        Computes an encoding of the point on first use, and caches it on the
+        instance for later calls.
+        """
+        cache = self.__dict__.setdefault("_cache", {})
+        try:
+            return cache[key]
+        except KeyError:
+            cache[key] = value = compute()
+            return value
 
     def sec(self, compressed: bool = True) -> bytes:
         """
@@ -45,6 +248,9 @@ class S256Point(Point):
 
         All 256 bit integers are encoded in 32 bytes, big-endian.
         """
+        return self._cached(("sec", compressed), lambda: self._sec(compressed))
+
+    def _sec(self, compressed: bool) -> bytes:
         if compressed:
             if self.y.number % 2 == 0:
                 return b"\x02" + self.x.number.to_bytes(32, "big")
@@ -58,7 +264,31 @@ class S256Point(Point):
             )
 
     @classmethod
-    def parse(cls, sec_bin: bytes) -> "S256Point":
+    def parse(cls, sec_bin: bytes, cache: bool = True) -> "S256Point":
+        """
+        Parses a point serialized in SEC format.
+
+        Decompressing a point costs a square root, which is a 256-bit modular
+        exponentiation, so the coordinates of parsed points are kept in a bounded
+        LRU cache keyed by their SEC bytes. Every call returns a new point, which the
+        caller is free to modify. Pass cache=False to bypass the cache, or see
+        configure_parse_cache() to resize or disable it.
+        """
+        if not cache or not parse_cache().maxsize:
+            return cls._parse(sec_bin)
+
+        key = bytes(sec_bin)
+        coordinates = parse_cache().get(key)
+        if coordinates is not None:
+            # Already checked to be on the curve when first parsed
+            return cls._from_affine(coordinates)
+
+        point = cls._parse(key)
+        parse_cache().put(key, point._affine())
+        return point
+
+    @classmethod
+    def _parse(cls, sec_bin: bytes) -> "S256Point":
         # Handle the case of uncompressed SEC format
         if sec_bin[0] == 4:  # check if prefix byte is b'\x04'
             return cls(
@@ -88,10 +318,126 @@ class S256Point(Point):
             else:
                 return cls(x=x, y=y)
 
+    def hash160(self, compressed: bool = True) -> bytes:
+        return self._cached(
+            ("hash160", compressed), lambda: hash160(self.sec(compressed))
+        )
+
     def address(self, compressed: bool = True, testnet: bool = False) -> str:
-        h160 = hash160(self.sec(compressed))
+        return self._cached(
+            ("address", compressed, testnet),
+            lambda: self._address(compressed, testnet),
+        )
+
+    def _address(self, compressed: bool, testnet: bool) -> str:
+        h160 = self.hash160(compressed)
         prefix = b"\x6f" if testnet else b"\x00"
         return encode_base58_checksum(prefix + h160)
 
 
-G = S256Point(x=Gx, y=Gy)
+@lru_cache(maxsize=None)
+def parse_cache() -> "LRUCache":
+    """
+    Coordinates of the points parsed by S256Point.parse(), keyed by SEC bytes. It is
+    also available as the module attribute PARSE_CACHE.
+    """
+    from .cache import LRUCache
+
+    return LRUCache(maxsize=4096)
+
+
+def configure_parse_cache(maxsize: int):
+    """
+    Sets the maximum number of points kept by the cache of S256Point.parse(), and
+    evicts the least recently used ones if needed. A maxsize of 0 disables the cache.
+    """
+    parse_cache().resize(maxsize)
+
+
+def parse_cache_info() -> Dict[str, int]:
+    """
+    Returns the hits, misses, current size and maximum size of the parse cache.
+    """
+    return parse_cache().info()
+
+
+@lru_cache(maxsize=None)
+def signature_cache() -> "SignatureCache":
+    """
+    Cache of successful S256Point.verify() calls, disabled by default. It is also
+    available as the module attribute SIGNATURE_CACHE.
+    """
+    from .cache import SignatureCache
+
+    return SignatureCache(maxsize=0)
+
+
+def configure_signature_cache(maxsize: int):
+    """
+    Sets the maximum number of verified signatures remembered by S256Point.verify(),
+    and evicts the least recently used ones if needed. A maxsize of 0, the default,
+    disables the cache.
+    """
+    signature_cache().resize(maxsize)
+
+
+def signature_cache_info() -> Dict[str, float]:
+    """
+    Returns the hits, misses, hit rate, current size and maximum size of the
+    signature cache.
+    """
+    cache = signature_cache()
+    return {**cache.info(), "hit_rate": cache.hit_rate()}
+
+
+@lru_cache(maxsize=None)
+def key_tables() -> "TableCache":
+    """
+    Tables of the most frequently used public keys, disabled by default. It is also
+    available as the module attribute KEY_TABLES.
+    """
+    from .cache import TableCache
+
+    return TableCache(max_bytes=0)
+
+
+def configure_key_tables(max_bytes: int, threshold: Optional[int] = None):
+    """
+    Sets the memory budget, in bytes, of the tables cached for hot public keys, and
+    evicts the least recently used ones if needed. A key is hot once it has been
+    used threshold times, by S256Point.verify() or any other multiplication. A
+    max_bytes of 0, the default, disables the cache.
+    """
+    key_tables().configure(max_bytes, threshold)
+
+
+def key_tables_info() -> Dict[str, int]:
+    """
+    Returns the hits, misses, builds, evictions, size, memory footprint and budget
+    of the hot key tables.
+    """
+    return key_tables().info()
+
+
+@lru_cache(maxsize=None)
+def generator() -> S256Point:
+    """
+    The generator point G, built on first use and shared by the whole package. It
+    is also available as the module attribute G.
+    """
+    return S256Point(x=Gx, y=Gy)
+
+
+def __getattr__(name: str) -> Any:
+    # Curve objects and caches are built lazily, so that importing the package stays
+    # cheap for short-lived processes, such as the workers of parallel.py and
+    # derive.py.
+    if name == "G":
+        return generator()
+    if name == "PARSE_CACHE":
+        return parse_cache()
+    if name == "SIGNATURE_CACHE":
+        return signature_cache()
+    if name == "KEY_TABLES":
+        return key_tables()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
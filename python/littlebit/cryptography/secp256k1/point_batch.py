@@ -0,0 +1,211 @@
+"""
+Compact storage for many secp256k1 points, such as an index of public keys.
+
+An S256Point holds four S256FieldElement objects, the curve coefficients a and b
+included, plus the cache of its encodings: several hundred bytes per point. A
+PointBatch stores the coordinates of all its points in two contiguous buffers of
+32-byte big-endian integers, which is 64 bytes per point.
+
+Usage:
+    keys = PointBatch.parse(sec_blob)   # concatenated SEC encodings
+    keys[3].sec()                       # lightweight view, no S256Point created
+    keys.verify(zs, signatures)         # see verify_batch()
+"""
+from typing import Iterable, Iterator, List, Sequence, Union, overload
+
+from .constants import B, P
+from .jacobian import AffinePoint
+from .point import S256Point
+from .signature import Signature
+
+SIZE = 32
+
+
+class PointView:
+    """
+    A point of a PointBatch, read in place. x and y are integers, not field
+    elements. It can be passed to verify_batch() like an S256Point.
+    """
+
+    __slots__ = ("batch", "index")
+
+    # Points at infinity can't be stored in a PointBatch
+    is_identity = False
+
+    def __init__(self, batch: "PointBatch", index: int):
+        self.batch = batch
+        self.index = index
+
+    def __repr__(self):
+        return f"PointView({self.x:x}, {self.y:x})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, PointView):
+            return self._affine() == other._affine()
+        if isinstance(other, S256Point):
+            return not other.is_identity and self._affine() == other._affine()
+        return NotImplemented
+
+    @property
+    def x(self) -> int:
+        return int.from_bytes(self.batch._x_bytes(self.index), "big")
+
+    @property
+    def y(self) -> int:
+        return int.from_bytes(self.batch._y_bytes(self.index), "big")
+
+    def _affine(self) -> AffinePoint:
+        return self.x, self.y
+
+    def sec(self, compressed: bool = True) -> bytes:
+        x = self.batch._x_bytes(self.index)
+        y = self.batch._y_bytes(self.index)
+        if compressed:
+            return (b"\x03" if y[-1] & 1 else b"\x02") + x
+        return b"\x04" + x + y
+
+    def point(self) -> S256Point:
+        return S256Point._from_affine(self._affine())
+
+
+class PointBatch:
+    __slots__ = ("_xs", "_ys")
+
+    def __init__(self, points: Iterable[Union[S256Point, PointView]] = ()):
+        self._xs = bytearray()
+        self._ys = bytearray()
+        self.extend(points)
+
+    def __len__(self) -> int:
+        return len(self._xs) // SIZE
+
+    def __repr__(self):
+        return f"PointBatch(<{len(self)} points>)"
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, PointBatch):
+            return NotImplemented
+        return self._xs == other._xs and self._ys == other._ys
+
+    @overload
+    def __getitem__(self, index: int) -> PointView:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> "PointBatch":
+        ...
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            start, stop, step = index.indices(len(self))
+            if step != 1:
+                return PointBatch(self[i] for i in range(start, stop, step))
+
+            batch = PointBatch()
+            batch._xs = self._xs[start * SIZE : stop * SIZE]
+            batch._ys = self._ys[start * SIZE : stop * SIZE]
+            return batch
+
+        size = len(self)
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("PointBatch index out of range")
+        return PointView(self, index)
+
+    def __iter__(self) -> Iterator[PointView]:
+        for i in range(len(self)):
+            yield PointView(self, i)
+
+    def _x_bytes(self, index: int) -> bytes:
+        return bytes(self._xs[index * SIZE : (index + 1) * SIZE])
+
+    def _y_bytes(self, index: int) -> bytes:
+        return bytes(self._ys[index * SIZE : (index + 1) * SIZE])
+
+    def append(self, point: Union[S256Point, PointView]):
+        if point.is_identity:
+            raise ValueError("Cannot store the point at infinity in a PointBatch")
+
+        x, y = point._affine()
+        self._xs += x.to_bytes(SIZE, "big")
+        self._ys += y.to_bytes(SIZE, "big")
+
+    def extend(self, points: Iterable[Union[S256Point, PointView]]):
+        for point in points:
+            self.append(point)
+
+    def affine(self) -> List[AffinePoint]:
+        xs, ys = self._xs, self._ys
+        return [
+            (
+                int.from_bytes(xs[i : i + SIZE], "big"),
+                int.from_bytes(ys[i : i + SIZE], "big"),
+            )
+            for i in range(0, len(xs), SIZE)
+        ]
+
+    def sec(self, compressed: bool = True) -> bytes:
+        """
+        Returns the SEC encodings of all the points, concatenated.
+        """
+        xs, ys = self._xs, self._ys
+        parts: List[Union[bytes, bytearray]] = []
+        for i in range(0, len(xs), SIZE):
+            if compressed:
+                parts.append(b"\x03" if ys[i + SIZE - 1] & 1 else b"\x02")
+                parts.append(xs[i : i + SIZE])
+            else:
+                parts += (b"\x04", xs[i : i + SIZE], ys[i : i + SIZE])
+        return b"".join(parts)
+
+    @classmethod
+    def parse(cls, buffer) -> "PointBatch":
+        """
+        Parses concatenated SEC encodings, compressed or not, from bytes or any
+        object supporting the buffer protocol. Every point is checked to be on the
+        curve.
+        """
+        view = memoryview(buffer).cast("B")
+        batch = cls()
+        offset, end = 0, len(view)
+        while offset < end:
+            prefix = view[offset]
+            if prefix not in (2, 3, 4):
+                raise ValueError(f"Invalid SEC prefix at offset {offset}")
+
+            length = 65 if prefix == 4 else 33
+            if offset + length > end:
+                raise ValueError(f"Truncated SEC encoding at offset {offset}")
+
+            x = int.from_bytes(view[offset + 1 : offset + 33], "big")
+            if x >= P:
+                raise ValueError(f"Invalid x coordinate at offset {offset}")
+
+            # Right side of the equation: y² = x³ + 7
+            alpha = (pow(x, 3, P) + B) % P
+            if prefix == 4:
+                y = int.from_bytes(view[offset + 33 : offset + 65], "big")
+                if y >= P or (y * y) % P != alpha:
+                    raise ValueError(f"Point at offset {offset} is not on the curve")
+            else:
+                y = pow(alpha, (P + 1) // 4, P)  # see S256FieldElement.sqrt()
+                if (y * y) % P != alpha:
+                    raise ValueError(f"Point at offset {offset} is not on the curve")
+                if y & 1 != prefix & 1:
+                    y = P - y
+
+            batch._xs += view[offset + 1 : offset + 33]
+            batch._ys += y.to_bytes(SIZE, "big")
+            offset += length
+        return batch
+
+    def verify(self, zs: Sequence[int], signatures: Sequence[Signature]) -> List[bool]:
+        """
+        Verifies the i-th signature of z[i] against the i-th point of the batch.
+        """
+        from .batch import verify_batch
+
+        if not len(self) == len(zs) == len(signatures):
+            raise ValueError("Expected as many z values and signatures as points")
+        return verify_batch(zip(self, zs, signatures))
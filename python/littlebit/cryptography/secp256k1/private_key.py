@@ -1,22 +1,47 @@
 import hmac
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from hashlib import sha256
+from typing import Any, Callable, Tuple
 
 from ..utils import encode_base58_checksum
-from .constants import Gx, Gy, N
-from .point import S256Point
+from .constants import N
+from .point import S256Point, generator
 from .signature import Signature
 
-G = S256Point(x=Gx, y=Gy)
+
+def __getattr__(name: str) -> Any:
+    # G used to be defined here too. It now lives in point.py, see generator().
+    if name == "G":
+        return generator()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 @dataclass
 class PrivateKey:
     secret: int
-    point: int = field(init=False)  # public key
 
-    def __post_init__(self):
-        self.point = self.secret * G
+    def __setattr__(self, name, value):
+        # The public key and the encodings are derived from the secret, so they
+        # must be computed again if the secret is ever replaced.
+        if name == "secret":
+            self.__dict__.pop("_cache", None)
+        super().__setattr__(name, value)
+
+    def _cached(self, key: Tuple, compute: Callable[[], Any]) -> Any:
+        cache = self.__dict__.setdefault("_cache", {})
+        try:
+            return cache[key]
+        except KeyError:
+            cache[key] = value = compute()
+            return value
+
+    @property
+    def point(self) -> S256Point:
+        """
+        The public key, computed on first use. Creating many private keys doesn't
+        cost a scalar multiplication each, until their public key is needed.
+        """
+        return self._cached(("point",), lambda: self.secret * generator())
 
     @property
     def hex(self) -> str:
@@ -24,9 +49,9 @@ class PrivateKey:
 
     def sign(self, z: int) -> Signature:
         k = self.deterministic_k(z)  # or, randint(0, N)
-        R = k * G
+        R = k * generator()
         r = R.x.number
-        k_inv = pow(k, N - 2, N)
+        k_inv = pow(k, -1, N)  # same as pow(k, N - 2, N), but much faster
         s = ((z + r * self.secret) * k_inv) % N
         if s > N / 2:
             s = N - s
@@ -61,6 +86,11 @@ class PrivateKey:
             v = hmac.new(k, v, sha256).digest()
 
     def wif(self, compressed: bool = True, testnet: bool = False) -> str:
+        return self._cached(
+            ("wif", compressed, testnet), lambda: self._wif(compressed, testnet)
+        )
+
+    def _wif(self, compressed: bool, testnet: bool) -> str:
         secret_bytes = self.secret.to_bytes(32, "big")
 
         prefix = b"\xef" if testnet else b"\x80"
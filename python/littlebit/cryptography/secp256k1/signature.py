@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import List, Tuple
 
 
 @dataclass
@@ -51,42 +52,92 @@ class Signature:
         return bytes([PREFIX, len(result)]) + result
 
     @classmethod
-    def parse(cls, signature_bin: bytes) -> "Signature":
-        sig = signature_bin  # store a copy of the binary data
+    def parse(cls, signature_bin, strict: bool = False) -> "Signature":
+        """
+        Parses a DER signature from bytes, or any object supporting the buffer
+        protocol (bytearray, memoryview, mmap, ...). The buffer is read in place,
+        by offset, without copying it.
+
+        If strict is True, the encoding must also follow the rules of BIP66: the
+        shortest possible encoding of positive integers, and no trailing data.
+        """
+        view = memoryview(signature_bin).cast("B")
+        signature, end = cls._parse_at(view, 0, strict)
+        if end != len(view):
+            raise ValueError("Bad Signature length")
+        return signature
+
+    @classmethod
+    def parse_many(cls, buffer, strict: bool = False) -> List["Signature"]:
+        """
+        Parses DER signatures concatenated one after the other in a single buffer.
+        """
+        view = memoryview(buffer).cast("B")
+        signatures = []
+        offset = 0
+        while offset < len(view):
+            signature, offset = cls._parse_at(view, offset, strict)
+            signatures.append(signature)
+        return signatures
 
-        prefix = sig[0]
+    @classmethod
+    def _parse_at(
+        cls, view: memoryview, offset: int, strict: bool
+    ) -> Tuple["Signature", int]:
+        """
+        Parses the DER signature which starts at the given offset of the buffer, and
+        returns it along with the offset right after its last byte.
+        """
+        # Every DER signature starts with: prefix (0x30), length of the rest
+        if len(view) - offset < 2:
+            raise ValueError("Signature too short")
+
+        prefix, length = view[offset], view[offset + 1]
         if prefix != 0x30:
             raise ValueError("Invalid Signature prefix")
-        sig = sig[1:]  # remove the prifix byte
 
-        length = sig[0]
-        if len(signature_bin) != length + 2:
+        end = offset + 2 + length
+        if end > len(view):
             raise ValueError("Bad Signature length")
-        sig = sig[1:]  # remove the signature length byte
 
-        marker = sig[0]
-        if marker != 0x02:
-            raise ValueError("Bad Signature")
-        sig = sig[1:]  # remove the marker byte
+        if strict and not 8 <= length + 2 <= 72:
+            raise ValueError("Bad Signature length")
 
-        rlen = sig[0]
-        sig = sig[1:]  # remove the rlen byte
+        cursor = offset + 2  # skip the prefix and length bytes
+        r, cursor = cls._parse_integer(view, cursor, end, strict)
+        s, cursor = cls._parse_integer(view, cursor, end, strict)
 
-        r = int.from_bytes(sig[:rlen], byteorder="big")
-        sig = sig[rlen:]  # remove r
+        if cursor != end:
+            raise ValueError("Signature too long")
 
-        marker = sig[0]
-        if marker != 0x02:
-            raise ValueError("Bad Signature")
-        sig = sig[1:]  # remove the marker byte
+        return cls(r, s), end
 
-        slen = sig[0]
-        sig = sig[1:]  # remove the slen byte
+    @staticmethod
+    def _parse_integer(
+        view: memoryview, cursor: int, end: int, strict: bool
+    ) -> Tuple[int, int]:
+        # Each integer is encoded as: marker (0x02), length, big-endian bytes
+        if end - cursor < 2:
+            raise ValueError("Signature too short")
 
-        s = int.from_bytes(sig[:slen], byteorder="big")
-        sig = sig[slen:]  # remove s
+        marker, length = view[cursor], view[cursor + 1]
+        if marker != 0x02:
+            raise ValueError("Bad Signature")
 
-        if sig:
-            raise ValueError("Signature too long")
+        start = cursor + 2
+        if start + length > end:
+            raise ValueError("Bad Signature length")
 
-        return cls(r, s)
+        if strict:
+            # BIP66: integers must be positive, and as short as possible. That means
+            # no empty integer, no first bit set (negative), and no leading null byte
+            # unless it is needed to keep the next byte from looking negative.
+            if not length:
+                raise ValueError("Zero-length integer in Signature")
+            if view[start] & 0x80:
+                raise ValueError("Negative integer in Signature")
+            if length > 1 and not view[start] and not view[start + 1] & 0x80:
+                raise ValueError("Non-minimal integer encoding in Signature")
+
+        number = int.from_bytes(view[start : start + length], byteorder="big")
+        return number, start + length
@@ -0,0 +1,286 @@
+"""
+Vectorized secp256k1 arithmetic on many field elements at once, with NumPy.
+
+This module requires NumPy, which is an optional dependency of littlebit. It is
+only imported when the "numpy" backend is selected, see backend.py.
+
+A batch of n field elements is stored as a (10, n) array of int64 limbs, where
+limb i holds bits 26i to 26i + 25 of every element:
+    a = a₀ + a₁2²⁶ + a₂2⁵² + ... + a₉2²³⁴
+Every arithmetic operation works on the whole batch with a handful of NumPy
+calls per limb, instead of one Python big integer operation per element.
+
+Limbs are kept normalized, in the range 0 to 2²⁶ - 1, so that the product of two
+limbs fits in 52 bits, and the sum of the 10 products of a column in 56 bits,
+well within int64. Normalized elements are only reduced below 2²⁶⁰, not below P:
+the canonical value is computed when converting back to Python integers.
+
+Like the rest of the package, nothing here runs in constant time.
+"""
+from functools import lru_cache
+from typing import List, Sequence, Tuple
+
+import numpy as np
+
+from .constants import N, P
+from .jacobian import JacobianPoint
+from .point import generator_table
+
+Limbs = np.ndarray
+VectorPoint = Tuple[Limbs, Limbs, Limbs]
+
+LIMBS = 10
+BITS = 26
+MASK = (1 << BITS) - 1
+
+###############################################################################
+# Folding the bits above 2²⁶⁰                                                 #
+#                                                                             #
+#     P = 2²⁵⁶ - 2³² - 977                                                    #
+# =>  2²⁵⁶ ≡ 2³² + 977  (mod P)                                               #
+# =>  2²⁶⁰ ≡ 2³⁶ + 15632 = 2¹⁰ x 2²⁶ + 15632  (mod P)                         #
+#                                                                             #
+# So a carry c out of the top limb is worth 15632c in limb 0, plus 2¹⁰c in    #
+# limb 1.                                                                     #
+###############################################################################
+FOLD_LOW = 15632
+FOLD_HIGH = 1 << 10
+
+
+def _limbs(number: int) -> List[int]:
+    return [(number >> (BITS * i)) & MASK for i in range(LIMBS)]
+
+
+# Every multiple of P below 2²⁶⁰, which are the normalized representations of 0
+P_MULTIPLES = np.array([_limbs(k * P) for k in range(17)], dtype=np.int64)
+
+
+def from_ints(numbers: Sequence[int]) -> Limbs:
+    values = np.array([number % P for number in numbers], dtype=object)
+    limbs = np.zeros((LIMBS, len(values)), dtype=np.int64)
+    for i in range(LIMBS):
+        limbs[i] = (values >> (BITS * i)) & MASK
+    return limbs
+
+
+def to_ints(limbs: Limbs) -> List[int]:
+    values = np.zeros(limbs.shape[1], dtype=object)
+    for limb in limbs[::-1]:
+        values = (values << BITS) + limb.astype(object)
+    return [int(value) % P for value in values]
+
+
+def constant(number: int, size: int) -> Limbs:
+    return np.repeat(np.array(_limbs(number), dtype=np.int64)[:, None], size, axis=1)
+
+
+def _carry(limbs: Limbs) -> Limbs:
+    """
+    Normalizes the limbs in place. They can be negative, or larger than 26 bits,
+    as long as the carries don't overflow int64.
+    """
+    while True:
+        for i in range(LIMBS - 1):
+            limbs[i + 1] += limbs[i] >> BITS  # arithmetic shift, for negative limbs
+            limbs[i] &= MASK
+
+        top = limbs[-1] >> BITS
+        if not top.any():
+            return limbs
+
+        limbs[-1] &= MASK
+        limbs[0] += top * FOLD_LOW
+        limbs[1] += top * FOLD_HIGH
+
+
+def add(a: Limbs, b: Limbs) -> Limbs:
+    return _carry(a + b)
+
+
+def sub(a: Limbs, b: Limbs) -> Limbs:
+    return _carry(a - b)
+
+
+def mul_small(a: Limbs, k: int) -> Limbs:
+    return _carry(a * k)
+
+
+def mul(a: Limbs, b: Limbs) -> Limbs:
+    # Schoolbook multiplication: column i + j accumulates aᵢbⱼ
+    columns = np.zeros((2 * LIMBS, a.shape[1]), dtype=np.int64)
+    for i in range(LIMBS):
+        columns[i : i + LIMBS] += a[i] * b
+
+    # Normalize the 19 columns, the last carry going to column 19
+    for i in range(2 * LIMBS - 1):
+        columns[i + 1] += columns[i] >> BITS
+        columns[i] &= MASK
+
+    # Fold column 10 + j, worth 2²⁶⁰ x 2²⁶ʲ, into columns j and j + 1. Column 19
+    # folds into column 10, which is worth 2²⁶⁰ again, so it is folded twice.
+    low, high = columns[:LIMBS], columns[LIMBS:]
+    low += high * FOLD_LOW
+    low[1:] += high[:-1] * FOLD_HIGH
+    top = high[-1] * FOLD_HIGH
+    low[0] += top * FOLD_LOW
+    low[1] += top * FOLD_HIGH
+    return _carry(low)
+
+
+def square(a: Limbs) -> Limbs:
+    return mul(a, a)
+
+
+def is_zero(a: Limbs) -> np.ndarray:
+    """
+    Returns a boolean array, True where the element is 0 modulo P.
+    """
+    return (a[None, :, :] == P_MULTIPLES[:, :, None]).all(axis=1).any(axis=0)
+
+
+def _select(mask: np.ndarray, p: VectorPoint, q: VectorPoint) -> VectorPoint:
+    """
+    Picks the coordinates of p where mask is True, and the ones of q elsewhere.
+    """
+    X, Y, Z = (np.where(mask, a, b) for a, b in zip(p, q))
+    return X, Y, Z
+
+
+def from_points(points: Sequence[JacobianPoint]) -> VectorPoint:
+    return (
+        from_ints([point[0] for point in points]),
+        from_ints([point[1] for point in points]),
+        from_ints([point[2] for point in points]),
+    )
+
+
+def to_points(point: VectorPoint) -> List[JacobianPoint]:
+    return list(zip(*(to_ints(coordinate) for coordinate in point)))
+
+
+def infinity(size: int) -> VectorPoint:
+    return constant(0, size), constant(1, size), constant(0, size)
+
+
+def double(point: VectorPoint) -> VectorPoint:
+    """
+    Same formula as jacobian.double(). The point at infinity, where Z = 0, gives
+    Z₃ = 2Y₁Z₁ = 0, so it needs no special case.
+    """
+    X1, Y1, Z1 = point
+
+    A = square(X1)
+    B = square(Y1)
+    C = square(B)
+    XB = add(X1, B)
+    D = mul_small(sub(sub(square(XB), A), C), 2)
+    E = mul_small(A, 3)
+    F = square(E)
+
+    X3 = sub(F, mul_small(D, 2))
+    Y3 = sub(mul(E, sub(D, X3)), mul_small(C, 8))
+    Z3 = mul_small(mul(Y1, Z1), 2)
+    return X3, Y3, Z3
+
+
+def add_points(p: VectorPoint, q: VectorPoint) -> VectorPoint:
+    """
+    Same formula as jacobian.add(), with the special cases handled with masks.
+    """
+    X1, Y1, Z1 = p
+    X2, Y2, Z2 = q
+
+    Z1Z1 = square(Z1)
+    Z2Z2 = square(Z2)
+    U1 = mul(X1, Z2Z2)
+    U2 = mul(X2, Z1Z1)
+    S1 = mul(Y1, mul(Z2, Z2Z2))
+    S2 = mul(Y2, mul(Z1, Z1Z1))
+
+    H = sub(U2, U1)
+    R = sub(S2, S1)
+    HH = square(H)
+    HHH = mul(H, HH)
+    V = mul(U1, HH)
+
+    X3 = sub(sub(square(R), HHH), mul_small(V, 2))
+    Y3 = sub(mul(R, sub(V, X3)), mul(S1, HHH))
+    Z3 = mul(mul(Z1, Z2), H)
+    result = X3, Y3, Z3
+
+    # P + (-P) already gives Z₃ = 0. P + P needs a doubling instead.
+    tangent = is_zero(H) & is_zero(R)
+    if tangent.any():
+        result = _select(tangent, double(p), result)
+
+    p_infinity, q_infinity = is_zero(Z1), is_zero(Z2)
+    result = _select(p_infinity, q, result)
+    return _select(q_infinity & ~p_infinity, p, result)
+
+
+def add_affine(p: VectorPoint, q: Tuple[Limbs, Limbs]) -> VectorPoint:
+    """
+    Same formula as jacobian.add_affine(), with the special cases handled with
+    masks.
+    """
+    X1, Y1, Z1 = p
+    x2, y2 = q
+
+    Z1Z1 = square(Z1)
+    U2 = mul(x2, Z1Z1)
+    S2 = mul(y2, mul(Z1, Z1Z1))
+
+    H = sub(U2, X1)
+    R = sub(S2, Y1)
+    HH = square(H)
+    HHH = mul(H, HH)
+    V = mul(X1, HH)
+
+    X3 = sub(sub(square(R), HHH), mul_small(V, 2))
+    Y3 = sub(mul(R, sub(V, X3)), mul(Y1, HHH))
+    Z3 = mul(Z1, H)
+    result = X3, Y3, Z3
+
+    tangent = is_zero(H) & is_zero(R)
+    if tangent.any():
+        result = _select(tangent, double(p), result)
+
+    return _select(is_zero(Z1), (x2, y2, constant(1, x2.shape[1])), result)
+
+
+@lru_cache(maxsize=None)
+def _generator_table() -> Tuple[np.ndarray, np.ndarray]:
+    # The x and y coordinates of generator_table(), as two arrays of shape
+    # (rows, 2ʷ - 1, LIMBS)
+    table = generator_table()
+    xs = np.array([[_limbs(x) for x, _ in row] for row in table], dtype=np.int64)
+    ys = np.array([[_limbs(y) for _, y in row] for row in table], dtype=np.int64)
+    return xs, ys
+
+
+def multiply_generator(coefficients: Sequence[int]) -> List[JacobianPoint]:
+    """
+    Computes k * G for every k, with the same fixed-base table as
+    point.multiply_generator(), and one vectorized mixed addition per row of the
+    table for the whole batch.
+    """
+    xs, ys = _generator_table()
+    window = xs.shape[1].bit_length()
+    mask = (1 << window) - 1
+
+    scalars = [coefficient % N for coefficient in coefficients]
+    result = infinity(len(scalars))
+    for row, (row_x, row_y) in enumerate(zip(xs, ys)):
+        digits = np.array(
+            [(k >> (window * row)) & mask for k in scalars], dtype=np.int64
+        )
+        if not digits.any():
+            continue
+
+        # Rows with a zero digit fetch any entry, and keep their previous result
+        index = np.maximum(digits - 1, 0)
+        entry = np.ascontiguousarray(row_x[index].T), np.ascontiguousarray(
+            row_y[index].T
+        )
+        result = _select(digits != 0, add_affine(result, entry), result)
+    return to_points(result)
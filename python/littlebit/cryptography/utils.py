@@ -1,4 +1,5 @@
 import hashlib
+from typing import Iterable, List
 
 BASE58_CHARSET = "123456789ABCDEFGHJKLMNPQRSTUVWXYZabcdefghijkmnopqrstuvwxyz"
 
@@ -17,14 +18,20 @@ def hash256(s):
     return hashlib.sha256(hashlib.sha256(s).digest()).digest()
 
 
+# The conversion to and from base58 works on chunks of 10 base58 digits, so that most
+# of the arithmetic is done on machine-sized integers, and the number of operations
+# on the big integer is divided by 10.
+BASE58_CHUNK_DIGITS = 10
+BASE58_CHUNK = 58 ** BASE58_CHUNK_DIGITS
+
+# Base58 representation of every number from 0 to 58² - 1, on 2 digits
+BASE58_PAIRS = [a + b for a in BASE58_CHARSET for b in BASE58_CHARSET]
+BASE58_INDEX = {char: index for index, char in enumerate(BASE58_CHARSET)}
+
+
 def encode_base58(bytestring: bytes) -> str:
     # Count the number of leading zeros in the bytestring
-    leading_zeros = 0
-    for byte in bytestring:
-        if byte == 0x00:  # fancy way of saying zero
-            leading_zeros += 1
-        else:
-            break
+    leading_zeros = len(bytestring) - len(bytes(bytestring).lstrip(b"\x00"))
 
     num = int.from_bytes(bytestring, "big")
 
@@ -35,14 +42,42 @@ def encode_base58(bytestring: bytes) -> str:
     # all leading 0x00's to 1's
     prefix = "1" * leading_zeros
 
-    result = ""
+    # Digits are produced from the least significant one, so we collect chunks in a
+    # list and reverse it at the end, instead of prepending to a string each time.
+    chunks = []
     while num > 0:
-        num, mod = divmod(num, 58)
-        result = BASE58_CHARSET[mod] + result
+        num, chunk = divmod(num, BASE58_CHUNK)
+        for _ in range(BASE58_CHUNK_DIGITS // 2):
+            chunk, pair = divmod(chunk, 58 * 58)
+            chunks.append(BASE58_PAIRS[pair])
+
+    # The most significant chunk is padded with zeros, i.e. "1" characters
+    result = "".join(reversed(chunks)).lstrip("1")
 
     return prefix + result
 
 
+def decode_base58(string: str) -> bytes:
+    """
+    Inverse of encode_base58(). Raises ValueError on characters outside of the base58
+    alphabet.
+    """
+    leading_zeros = len(string) - len(string.lstrip("1"))
+
+    num = 0
+    try:
+        for start in range(0, len(string), BASE58_CHUNK_DIGITS):
+            chunk = string[start : start + BASE58_CHUNK_DIGITS]
+            value = 0
+            for char in chunk:
+                value = value * 58 + BASE58_INDEX[char]
+            num = num * 58 ** len(chunk) + value
+    except KeyError as exc:
+        raise ValueError(f"Invalid base58 character: {exc.args[0]!r}") from None
+
+    return b"\x00" * leading_zeros + num.to_bytes((num.bit_length() + 7) // 8, "big")
+
+
 def checksum(bytestring: bytes):
     """
     A Checksum is the first 4 bytes of the hash256 of a bytestring
@@ -56,3 +91,34 @@ def encode_base58_checksum(bytestring: bytes) -> str:
     encoded into base58.
     """
     return encode_base58(bytestring + checksum(bytestring))
+
+
+def decode_base58_checksum(string: str) -> bytes:
+    """
+    Inverse of encode_base58_checksum(). Returns the bytestring without its checksum,
+    and raises ValueError if the checksum doesn't match.
+    """
+    bytestring = decode_base58(string)
+    if len(bytestring) < 4:
+        raise ValueError("Base58 string too short to hold a checksum")
+
+    payload, expected = bytestring[:-4], bytestring[-4:]
+    if checksum(payload) != expected:
+        raise ValueError("Bad base58 checksum")
+    return payload
+
+
+def encode_many(bytestrings: Iterable[bytes], with_checksum: bool = False) -> List[str]:
+    """
+    Encodes many bytestrings to base58, or base58 checksum if with_checksum is True.
+    """
+    encode = encode_base58_checksum if with_checksum else encode_base58
+    return [encode(bytestring) for bytestring in bytestrings]
+
+
+def decode_many(strings: Iterable[str], with_checksum: bool = False) -> List[bytes]:
+    """
+    Decodes many base58 strings, or base58 checksum strings if with_checksum is True.
+    """
+    decode = decode_base58_checksum if with_checksum else decode_base58
+    return [decode(string) for string in strings]
@@ -0,0 +1,5 @@
+from littlebit.cryptography import point
+
+# Also check that every point built internally, from the result of arithmetic, is
+# on its curve.
+point.DEBUG = True
@@ -0,0 +1,85 @@
+import pickle
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from littlebit.cryptography.curve import Curve
+from littlebit.cryptography.field import FieldElement
+from littlebit.cryptography.point import Point
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.point import SECP256K1, G, S256Point
+
+
+def test_curves_are_interned():
+    prime = 223
+    a, b = FieldElement(0, prime), FieldElement(7, prime)
+    p1 = Point(FieldElement(192, prime), FieldElement(105, prime), a, b)
+    p2 = Point(FieldElement(17, prime), FieldElement(56, prime), a, b)
+
+    assert p1.curve is p2.curve is (p1 + p2).curve
+    assert p1.curve is Curve.of(FieldElement(0, prime), FieldElement(7, prime))
+    assert p1.curve.p == prime and p1.curve.a_is_zero
+    assert p1.curve.n is None and p1.curve.G is None
+
+    assert Curve.of(5, 7) is Point(x=3, y=-7, a=5, b=7).curve
+    assert Curve.of(5, 7) is not Curve.of(-9, 0)
+    assert not Curve.of(5, 7).a_is_zero
+
+
+def test_secp256k1_curve():
+    point = 12345 * G
+    assert point.curve is G.curve is SECP256K1
+    assert S256Point(x=None, y=None).curve is SECP256K1
+    assert SECP256K1.n == N and SECP256K1.G is G
+    assert SECP256K1.a_is_zero
+
+    copy = pickle.loads(pickle.dumps(point))
+    assert copy == point and copy.curve is SECP256K1
+
+
+def test_curve_attributes_are_filled_in():
+    prime = 223
+    a, b = FieldElement(1, prime), FieldElement(7, prime)
+    curve = Curve.of(a, b)
+    assert Curve.of(a, b, n=2, generator=lambda: "G") is curve
+    assert curve.n == 2 and curve.G == "G"
+    assert Curve.of(a, b).n == 2
+
+    with pytest.raises(ValueError):
+        Curve.of(a, b, n=3)
+
+
+INTERNED_FIRST = """
+import pickle
+from littlebit.cryptography.curve import Curve
+from littlebit.cryptography.point import Point
+from littlebit.cryptography.secp256k1.constants import Gx, Gy
+from littlebit.cryptography.secp256k1.field import S256FieldElement
+
+a, b = S256FieldElement(0), S256FieldElement(7)
+{}
+
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.point import SECP256K1, G
+assert SECP256K1.n == N and SECP256K1.G is G
+"""
+
+
+@pytest.mark.parametrize(
+    "intern",
+    [
+        "Curve.of(a, b)",
+        "Point(S256FieldElement(Gx), S256FieldElement(Gy), a=a, b=b)",
+        "pickle.loads({!r})".format(pickle.dumps(SECP256K1)),
+    ],
+    ids=["curve", "point", "pickle"],
+)
+def test_secp256k1_curve_interned_first(intern):
+    # In a fresh interpreter, where secp256k1.point hasn't been imported yet
+    subprocess.run(
+        [sys.executable, "-c", INTERNED_FIRST.format(intern)],
+        check=True,
+        cwd=Path(__file__).parents[2],
+    )
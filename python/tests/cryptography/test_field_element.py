@@ -1,6 +1,6 @@
 import pytest
 
-from littlebit.cryptography.field import FieldElement
+from littlebit.cryptography.field import FieldElement, batch_inverse_mod
 
 
 def test_number_range():
@@ -89,3 +89,23 @@ def test_div():
 def test_rmul():
     assert 5 * FieldElement(number=18, prime=31) == FieldElement(number=28, prime=31)
     assert -4 * FieldElement(number=11, prime=31) == FieldElement(number=18, prime=31)
+
+
+def test_batch_inverse():
+    elements = [FieldElement(n, 31) for n in (3, 24, 1, 30, 17)]
+    inverses = FieldElement.batch_inverse(elements)
+    assert inverses == [FieldElement(1, 31) / element for element in elements]
+    assert FieldElement.batch_inverse([]) == []
+
+    with pytest.raises(TypeError):
+        FieldElement.batch_inverse([FieldElement(2, 31), FieldElement(2, 37)])
+
+    with pytest.raises(ZeroDivisionError):
+        FieldElement.batch_inverse([FieldElement(2, 31), FieldElement(0, 31)])
+
+
+def test_batch_inverse_mod():
+    n = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+    numbers = [1, 2, n - 1, 0xDEADBEEF, n + 5]
+    for number, inverse in zip(numbers, batch_inverse_mod(numbers, n)):
+        assert (number * inverse) % n == 1
@@ -0,0 +1,85 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from statistics import median
+
+# Time spent importing the modules of littlebit themselves, without the standard
+# library, relative to the time spent importing littlebit.cryptography.field alone,
+# both measured with -X importtime in the same test run. A fixed budget in
+# milliseconds would be flaky on a loaded machine, a ratio isn't. It is about 4 for
+# secp256k1.private_key, while precomputing any table at import time would make it
+# well over 10.
+IMPORT_BUDGET_RATIO = 10
+RUNS = 5
+
+SCRIPT = """
+import json, sys
+import littlebit.cryptography.secp256k1.private_key
+from littlebit.cryptography.secp256k1 import point
+
+print(json.dumps({
+    "modules": sorted(sys.modules),
+    "generator": point.generator.cache_info().currsize,
+    "generator_table": point.generator_table.cache_info().currsize,
+}))
+"""
+
+BASELINE_SCRIPT = "import littlebit.cryptography.field"
+
+
+def run_import(script):
+    # In a fresh interpreter, since the test suite has already imported everything
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True,
+        text=True,
+        check=True,
+        cwd=Path(__file__).parents[2],
+    )
+
+    # Lines look like: "import time:  self [us] | cumulative | imported package"
+    own = 0
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        if name.strip().startswith("littlebit"):
+            own += int(self_time)
+
+    return own, process.stdout
+
+
+def test_import_is_lazy():
+    _, output = run_import(SCRIPT)
+    state = json.loads(output)
+
+    # Nothing is precomputed at import time
+    assert state["generator"] == 0
+    assert state["generator_table"] == 0
+
+    # Optional and heavy modules are only imported when used
+    for module in (
+        "numpy",
+        "asyncio",
+        "concurrent.futures",
+        "secrets",
+        "threading",
+        "littlebit.cryptography.secp256k1.batch",
+        "littlebit.cryptography.secp256k1.cache",
+        "littlebit.cryptography.secp256k1.glv",
+        "littlebit.cryptography.secp256k1.jacobian",
+        "littlebit.cryptography.secp256k1.ladder",
+        "littlebit.cryptography.secp256k1.vectorized",
+    ):
+        assert module not in state["modules"]
+
+
+def test_import_time():
+    # Interleaved, so that both sides see the same load on the machine
+    times, baselines = [], []
+    for _ in range(RUNS):
+        times.append(run_import(SCRIPT)[0])
+        baselines.append(run_import(BASELINE_SCRIPT)[0])
+
+    assert median(times) < IMPORT_BUDGET_RATIO * median(baselines)
@@ -0,0 +1,78 @@
+from littlebit.cryptography import instrumentation
+from littlebit.cryptography.field import FieldElement
+from littlebit.cryptography.point import Point
+from littlebit.cryptography.secp256k1 import jacobian
+from littlebit.cryptography.secp256k1.point import S256Point
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+from littlebit.cryptography.secp256k1.signature import Signature
+
+
+def test_profile_generic_point_addition():
+    prime = 223
+    a, b = FieldElement(0, prime), FieldElement(7, prime)
+    p1 = Point(FieldElement(192, prime), FieldElement(105, prime), a, b)
+    p2 = Point(FieldElement(17, prime), FieldElement(56, prime), a, b)
+
+    with instrumentation.profile() as result:
+        p1 + p2
+        p1 + p1
+
+    operations = result.as_dict()["operations"]
+    assert operations["point_add"] == 1
+    assert operations["point_double"] == 1
+    assert operations["field_inv"] == 2
+
+
+def test_profile_sign_and_verify():
+    private_key = PrivateKey(12345)
+    z = 0xBEEF
+    # Build the lazily precomputed tables of G outside of the profile
+    private_key.point.verify(z, private_key.sign(z))
+
+    with instrumentation.profile() as result:
+        signature = private_key.sign(z)
+        assert private_key.point.verify(z, signature)
+        S256Point.parse(private_key.point.sec(), cache=False)
+        Signature.parse(signature.der())
+
+    profile = result.as_dict()
+    assert set(profile["calls"]) == {"sign", "verify", "parse_sec", "parse_der"}
+    for call in profile["calls"].values():
+        assert call["count"] == 1
+        assert call["seconds"] > 0
+
+    operations = profile["operations"]
+    # The GLV endomorphism halves the doubling chain of verify() to ~128 doublings
+    assert 120 <= operations["point_double"] <= 140
+    assert operations["field_sqrt"] == 1
+    assert operations["field_mul"] > operations["point_add"] > 0
+
+
+def test_profile_nesting_and_restore():
+    originals = FieldElement.__mul__, jacobian.double, S256Point.__dict__["parse"]
+    assert not instrumentation.enabled()
+
+    x, y = FieldElement(3, 7), FieldElement(5, 7)
+    with instrumentation.profile() as outer:
+        x * y
+        with instrumentation.profile() as inner:
+            x * y
+        assert instrumentation.enabled()
+
+    assert inner.operations["field_mul"] == 1
+    assert outer.operations["field_mul"] == 2
+    assert not instrumentation.enabled()
+    assert (FieldElement.__mul__, jacobian.double, S256Point.__dict__["parse"]) == (
+        originals
+    )
+
+
+def test_profile_prometheus_export():
+    with instrumentation.profile() as result:
+        PrivateKey(42).sign(1)
+
+    text = result.to_prometheus()
+    assert "# TYPE littlebit_operations_total counter\n" in text
+    assert 'littlebit_operations_total{operation="point_add"} ' in text
+    assert 'littlebit_calls_total{call="sign"} 1\n' in text
+    assert 'littlebit_call_seconds_total{call="sign"} ' in text
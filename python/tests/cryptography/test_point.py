@@ -1,5 +1,7 @@
 import pytest
 
+from littlebit.cryptography import point
+from littlebit.cryptography.curve import Curve
 from littlebit.cryptography.point import Point
 
 
@@ -40,3 +42,12 @@ def test_add__tangent_with_slope():
 def test_add__vertical_tangent():
     a = Point(x=3, y=0, a=-9, b=0)
     assert a + a == Point(x=None, y=None, a=-9, b=0)
+
+
+def test_unchecked_construction(monkeypatch):
+    monkeypatch.setattr(point, "DEBUG", False)
+    assert Point._unchecked(x=3, y=8, curve=Curve.of(5, 7)).y == 8
+
+    monkeypatch.setattr(point, "DEBUG", True)
+    with pytest.raises(ValueError):
+        Point._unchecked(x=3, y=8, curve=Curve.of(5, 7))
@@ -1,7 +1,23 @@
 from random import randint
 
-from littlebit.cryptography.secp256k1.constants import Gx, Gy, N
-from littlebit.cryptography.secp256k1.point import S256Point
+import pytest
+
+from littlebit.cryptography.field import FieldElement
+from littlebit.cryptography.secp256k1 import field
+from littlebit.cryptography.secp256k1.cache import SignatureCache, TableCache
+from littlebit.cryptography.secp256k1.constants import Gx, Gy, N, P
+from littlebit.cryptography.secp256k1.field import S256FieldElement
+from littlebit.cryptography.secp256k1.point import (
+    KEY_TABLES,
+    SIGNATURE_CACHE,
+    S256Point,
+    configure_key_tables,
+    configure_parse_cache,
+    configure_signature_cache,
+    key_tables_info,
+    parse_cache_info,
+    signature_cache_info,
+)
 from littlebit.cryptography.secp256k1.private_key import PrivateKey
 from littlebit.cryptography.secp256k1.signature import Signature
 
@@ -173,3 +189,262 @@ def test_wif():
     pk = PrivateKey(0x1CCA23DE92FD1862FB5B76E5F4F50EB082165E5191E116C18ED1A6B24BE6A53F)
     expected = "cNYfWuhDpbNM1JWc3c6JTrtrFVxU4AGhUKgw5f93NP2QaBqmxKkg"
     assert pk.wif(compressed=True, testnet=True) == expected
+
+
+def test_field_element():
+    with pytest.raises(ValueError):
+        S256FieldElement(P)
+
+    a, b = randint(1, P - 1), randint(1, P - 1)
+    x, y = S256FieldElement(a), S256FieldElement(b)
+    gx, gy = FieldElement(a, P), FieldElement(b, P)
+
+    assert x + y == gx + gy
+    assert x - y == gx - gy
+    assert x * y == gx * gy
+    assert x / y == gx / gy
+    assert x ** 5 == gx ** 5
+    assert 3 * x == 3 * gx
+    assert x + gy == gx + gy
+    assert type(x * y) is S256FieldElement
+
+    with pytest.raises(TypeError):
+        x + FieldElement(1, 31)
+
+    assert not hasattr(x, "__dict__")
+
+
+def test_field_arithmetic():
+    assert field.reduce((P - 1) * (P - 1)) == ((P - 1) * (P - 1)) % P
+
+    for a in (1, 2, P - 1, randint(1, P - 1), randint(1, P - 1)):
+        b = randint(0, P - 1)
+        assert field.reduce(a * b) == (a * b) % P
+        assert field.mul(a, b) == (a * b) % P
+        assert field.inverse(a) == pow(a, P - 2, P)
+        assert field.inverse_chain(a) == pow(a, P - 2, P)
+        assert field.sqrt(a) == pow(a, (P + 1) // 4, P)
+
+    with pytest.raises(ZeroDivisionError):
+        field.inverse(0)
+
+
+def test_parse_cache():
+    point = randint(1, N) * G
+    sec = point.sec()
+
+    configure_parse_cache(2)
+    try:
+        hits = parse_cache_info()["hits"]
+        first = S256Point.parse(sec)
+        assert S256Point.parse(sec) == first
+        assert S256Point.parse(bytearray(sec)) == first
+        assert parse_cache_info()["hits"] == hits + 2
+        assert S256Point.parse(sec, cache=False) == first
+
+        # Callers get their own instance, so modifying it doesn't affect the cache
+        assert S256Point.parse(sec) is not first
+        first.x, first.y = G.x, G.y
+        assert S256Point.parse(sec) == point
+        assert S256Point.parse(sec).sec() == sec
+
+        hits = parse_cache_info()["hits"]
+        S256Point.parse((2 * point).sec())
+        S256Point.parse((3 * point).sec())
+        assert parse_cache_info()["size"] == 2
+        assert S256Point.parse(sec) == point
+        assert parse_cache_info()["hits"] == hits  # evicted
+
+        configure_parse_cache(0)
+        assert parse_cache_info()["size"] == 0
+    finally:
+        configure_parse_cache(4096)
+
+
+def test_signature_cache():
+    private_key = PrivateKey(randint(1, N - 1))
+    point = private_key.point
+    z = randint(0, 2 ** 256)
+    signature = private_key.sign(z)
+
+    configure_signature_cache(2)
+    try:
+        assert point.verify(z, signature)
+        assert SIGNATURE_CACHE.contains(point, z, signature)
+        hits = signature_cache_info()["hits"]
+        assert point.verify(z, signature)
+        assert signature_cache_info()["hits"] == hits + 1
+        assert 0 < signature_cache_info()["hit_rate"] <= 1
+
+        # Same answers as without the cache, whatever the range of z
+        assert point.verify(z - N, signature)
+        assert point.verify(-1, private_key.sign(N - 1))
+
+        # Invalid signatures are never cached
+        assert not point.verify(z + 1, signature)
+        assert not SIGNATURE_CACHE.contains(point, z + 1, signature)
+
+        assert SIGNATURE_CACHE.erase(point, z, signature)
+        assert not SIGNATURE_CACHE.erase(point, z, signature)
+
+        # Pre-populated entries short-circuit the verification, so only trusted
+        # triples may be added.
+        forged = Signature(signature.r, N - 1)
+        SIGNATURE_CACHE.add(point, z, forged)
+        assert point.verify(z, forged)
+
+        configure_signature_cache(0)
+        assert signature_cache_info()["size"] == 0
+        assert not point.verify(z, forged)
+    finally:
+        configure_signature_cache(0)
+        SIGNATURE_CACHE.clear()
+
+
+def test_signature_cache_keys():
+    point, z, signature = G, 1, Signature(2, 3)
+    cache, other = SignatureCache(10), SignatureCache(10)
+    assert cache.key(point, z, signature) == cache.key(point, z, signature)
+    assert cache.key(point, z, signature) != other.key(point, z, signature)
+    assert cache.key(point, z, signature) != cache.key(point, z + 1, signature)
+    assert cache.key(point, z, signature) == cache.key(point, z + N, signature)
+    assert cache.key(point, -z, signature) == cache.key(point, N - z, signature)
+    assert cache.key(point, z, signature) != cache.key(2 * point, z, signature)
+    assert SignatureCache(10, salt=b"salt").key(point, z, signature) == SignatureCache(
+        10, salt=b"salt"
+    ).key(point, z, signature)
+
+
+def test_table_cache():
+    cache = TableCache(max_bytes=1000, threshold=2)
+    assert cache.lookup("a", lambda: [1]) is None
+    assert cache.lookup("a", lambda: [1]) == [1]  # hot, built
+    assert cache.lookup("a", lambda: [2]) == [1]  # cached
+    assert cache.info()["hits"] == 1 and cache.info()["builds"] == 1
+
+    for key in "cdefgh":
+        cache.lookup(key, lambda: list(range(10)))
+        cache.lookup(key, lambda: list(range(10)))
+    assert cache.info()["bytes"] <= 1000
+    assert cache.info()["evictions"] > 0 and "a" not in cache
+
+    # Too large for the budget: returned once, but neither cached nor built again
+    builds = []
+
+    def build():
+        builds.append(1)
+        return [0] * 200
+
+    assert cache.lookup("b", build) is None
+    assert cache.lookup("b", build) == [0] * 200
+    assert "b" not in cache and len(builds) == 1
+    for _ in range(5):
+        assert cache.lookup("b", build) is None
+        assert cache.lookup("i", lambda: [1]) is None
+    assert len(builds) == 1 and cache.info()["builds"] == 7
+
+    # Until the budget is raised
+    cache.configure(4000)
+    cache.lookup("b", build)
+    assert cache.lookup("b", build) == [0] * 200 and "b" in cache
+    assert len(builds) == 2
+
+    cache.configure(0)
+    assert len(cache) == 0 and cache.info()["bytes"] == 0
+    with pytest.raises(ValueError):
+        TableCache(max_bytes=1000, threshold=0)
+
+
+def test_key_tables():
+    private_key = PrivateKey(randint(1, N - 1))
+    point = private_key.point
+    signatures = [(z, private_key.sign(z)) for z in range(1, 6)]
+
+    configure_key_tables(1 << 20, threshold=2)
+    try:
+        for z, signature in signatures:
+            assert point.verify(z, signature)
+            assert not point.verify(z + 1, signature)
+
+        info = key_tables_info()
+        assert info["builds"] == 1 and info["size"] == 1
+        assert info["hits"] == 2 * len(signatures) - 2
+        assert 0 < info["bytes"] <= 1 << 20
+
+        # Multiplying by the cached tables gives the same result
+        k = randint(1, N - 1)
+        assert k * point == (k * private_key.secret) * G
+    finally:
+        configure_key_tables(0)
+        KEY_TABLES.clear()
+
+
+def test_cached_encodings():
+    point = S256Point(
+        0x5CBDF0646E5DB4EAA398F365F2EA7A0E3D419B7E0330E39CE92BDDEDCAC4F9BC,
+        0x6AEBCA40BA255960A3178D6D861A54DBA813D0B813FDE7B5A5082628087264DA,
+    )
+    sec = point.sec()
+    assert point.sec() is sec
+    assert point.sec(compressed=False) is not sec
+    assert point.address() is point.address()
+    assert point.address(testnet=True) != point.address()
+
+    other = 8 * G
+    point.x, point.y = other.x, other.y
+    assert point.sec() == other.sec()
+    assert point.address() == other.address()
+
+    # Same for points returned by the parse cache, without affecting later parses
+    parsed = S256Point.parse(sec)
+    assert parsed.sec() == sec
+    parsed.x, parsed.y = other.x, other.y
+    assert parsed.sec() == other.sec()
+    assert S256Point.parse(sec).sec() == sec
+
+    private_key = PrivateKey(7)
+    assert "_cache" not in private_key.__dict__  # public key not computed yet
+    assert private_key.point is private_key.point
+    assert private_key.wif() is private_key.wif()
+
+    private_key.secret = 8
+    assert private_key.point == other
+    assert private_key.wif() == PrivateKey(8).wif()
+
+
+def test_der_parse_buffers():
+    signatures = [Signature(randint(1, N), randint(1, N)) for _ in range(3)]
+    signatures.append(Signature(1, 2))
+    ders = [sig.der() for sig in signatures]
+    buffer = bytearray(b"".join(ders))
+
+    for der in ders:
+        assert Signature.parse(memoryview(der)) == Signature.parse(der)
+        assert Signature.parse(bytearray(der), strict=True) == Signature.parse(der)
+
+    assert Signature.parse_many(buffer) == signatures
+    assert Signature.parse_many(memoryview(buffer)[len(ders[0]) :]) == signatures[1:]
+    assert Signature.parse_many(b"") == []
+
+    with pytest.raises(ValueError):
+        Signature.parse_many(buffer[:-1])
+    with pytest.raises(ValueError):
+        Signature.parse(buffer)
+    with pytest.raises(ValueError):
+        Signature.parse(b"\x30")
+
+
+def test_der_strict():
+    valid = bytes.fromhex("3006020101020102")
+    assert Signature.parse(valid, strict=True) == Signature(1, 2)
+
+    invalid = (
+        "300702020001020102",  # r has an unneeded leading null byte
+        "3006020181020102",  # r is negative
+        "30050200020102",  # r is empty
+    )
+    for hex_string in invalid:
+        der = bytes.fromhex(hex_string)
+        Signature.parse(der)  # accepted when not strict
+        with pytest.raises(ValueError):
+            Signature.parse(der, strict=True)
@@ -0,0 +1,54 @@
+import asyncio
+from random import randint
+
+from littlebit.cryptography.secp256k1.aio import AsyncSigner, AsyncVerifier
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+def test_async_sign_and_verify():
+    private_keys = [PrivateKey(randint(1, N - 1)) for _ in range(10)]
+    hashes = [randint(0, 2 ** 256) for _ in range(10)]
+
+    async def main():
+        signer = AsyncSigner(max_batch_size=4, max_delay=0.01)
+        signatures = await asyncio.gather(
+            *(signer.sign(pk, z) for pk, z in zip(private_keys, hashes))
+        )
+        await signer.aclose()
+        assert signatures == [pk.sign(z) for pk, z in zip(private_keys, hashes)]
+
+        verifier = AsyncVerifier(max_batch_size=4, max_delay=0.01)
+        results = await asyncio.gather(
+            *(
+                verifier.verify(pk.point, z + (i == 3), sig)
+                for i, (pk, z, sig) in enumerate(zip(private_keys, hashes, signatures))
+            )
+        )
+        metrics = verifier.metrics()
+        await verifier.aclose()
+        return results, metrics
+
+    results, metrics = asyncio.run(main())
+    assert results == [i != 3 for i in range(10)]
+    assert metrics["items"] == 10
+    assert metrics["batches"] == 3
+    assert metrics["max_batch_size"] == 4
+    assert metrics["queue_depth"] == 0
+    assert metrics["pending"] == 0
+
+
+def test_aclose_flushes_queued_requests():
+    private_key = PrivateKey(randint(1, N - 1))
+    signature = private_key.sign(42)
+
+    async def main():
+        verifier = AsyncVerifier(max_batch_size=100, max_delay=10)
+        request = asyncio.ensure_future(
+            verifier.verify(private_key.point, 42, signature)
+        )
+        await asyncio.sleep(0)
+        await verifier.aclose()
+        return await request
+
+    assert asyncio.run(main())
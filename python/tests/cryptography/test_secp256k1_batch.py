@@ -0,0 +1,73 @@
+from random import randint
+
+from littlebit.cryptography.secp256k1 import verify_batch
+from littlebit.cryptography.secp256k1.constants import B, N, P
+from littlebit.cryptography.secp256k1.point import G, S256Point
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+from littlebit.cryptography.secp256k1.signature import Signature
+
+
+def make_items(count, keys=3):
+    private_keys = [PrivateKey(randint(1, N - 1)) for _ in range(keys)]
+    items = []
+    for i in range(count):
+        private_key = private_keys[i % keys]
+        z = randint(0, 2 ** 256)
+        items.append((private_key.point, z, private_key.sign(z)))
+    return items
+
+
+def test_verify_batch_all_valid():
+    assert verify_batch([]) == []
+    assert verify_batch(make_items(7)) == [True] * 7
+
+
+def test_verify_batch_locates_bad_entries():
+    items = make_items(6)
+    point, z, signature = items[1]
+    items[1] = (point, z + 1, signature)
+    point, z, signature = items[4]
+    items[4] = (G, z, signature)
+    items.append((point, z, Signature(0, signature.s)))
+    items.append((point, z, Signature(signature.r, N)))
+
+    results = verify_batch(items)
+    assert results == [True, False, True, True, False, True, False, False]
+    assert results == [point.verify(z, sig) for point, z, sig in items[:6]] + [
+        False,
+        False,
+    ]
+
+
+def test_verify_batch_matches_verify_when_x_exceeds_n():
+    # Find a point R whose x coordinate is larger than N, so that r = x - N
+    x = N + 1
+    while True:
+        alpha = (pow(x, 3, P) + B) % P
+        y = pow(alpha, (P + 1) // 4, P)
+        if (y * y) % P == alpha:
+            break
+        x += 1
+    R = S256Point(x, y)
+
+    # Build a public key Q such that u * G + v * Q = R for the signature (r, s)
+    r, s, z = x - N, randint(1, N - 1), randint(0, N - 1)
+    s_inv = pow(s, -1, N)
+    u, v = (z * s_inv) % N, (r * s_inv) % N
+    point = pow(v, -1, N) * (R + (N - u) * G)
+    signature = Signature(r, s)
+
+    assert point.verify(z, signature)
+    assert verify_batch([(point, z, signature)] * 2) == [True, True]
+    assert not point.verify(z, Signature(x, s))
+
+
+def test_verify_batch_matches_verify_for_point_at_infinity():
+    # Without a public key term, u * G = R only takes knowing k
+    identity = S256Point(None, None)
+    k, z = randint(1, N - 1), randint(0, N - 1)
+    r = (k * G).x.number
+    signature = Signature(r, (z * pow(k, -1, N)) % N)
+
+    assert not identity.verify(z, signature)
+    assert verify_batch([(identity, z, signature)]) == [False]
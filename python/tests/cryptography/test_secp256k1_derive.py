@@ -0,0 +1,42 @@
+from random import randint
+
+import pytest
+
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.derive import derive_addresses
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+def expected(secrets, compressed=True, testnet=False):
+    return [
+        (
+            secret,
+            PrivateKey(secret).point.sec(compressed),
+            PrivateKey(secret).point.address(compressed, testnet),
+        )
+        for secret in secrets
+    ]
+
+
+def test_derive_addresses():
+    start = randint(1, N - 100)
+    secrets = [1, 2, 3, N - 1] + list(range(start, start + 10)) + [randint(1, N - 1)]
+
+    assert list(derive_addresses(iter(secrets), chunk_size=4)) == expected(secrets)
+    assert list(derive_addresses(secrets, False, True)) == expected(
+        secrets, False, True
+    )
+    assert list(derive_addresses([])) == []
+
+
+def test_derive_addresses_processes():
+    secrets = [randint(1, N - 1) for _ in range(9)]
+    results = derive_addresses(secrets, chunk_size=2, processes=2)
+    assert list(results) == expected(secrets)
+
+
+def test_derive_addresses_out_of_range():
+    with pytest.raises(ValueError):
+        list(derive_addresses([1, 0]))
+    with pytest.raises(ValueError):
+        list(derive_addresses([N]))
@@ -0,0 +1,46 @@
+from random import randint
+
+from littlebit.cryptography.point import Point
+from littlebit.cryptography.secp256k1 import glv, jacobian
+from littlebit.cryptography.secp256k1.constants import BETA, LAMBDA, N, P
+from littlebit.cryptography.secp256k1.point import G, S256Point
+
+
+def naive_rmul(coefficient: int, point: S256Point) -> S256Point:
+    return Point.__rmul__(point, coefficient % N)
+
+
+def test_endomorphism():
+    point = LAMBDA * G
+    assert point.x.number == (BETA * G.x.number) % P
+    assert point.y == G.y
+
+
+def test_split_scalar():
+    for k in (0, 1, LAMBDA, N - 1, 2 ** 128, randint(0, N), randint(0, N)):
+        k1, k2 = glv.split_scalar(k)
+        assert (k1 + k2 * LAMBDA - k) % N == 0
+        assert abs(k1).bit_length() <= 129
+        assert abs(k2).bit_length() <= 129
+
+
+def test_rmul_matches_naive():
+    point = randint(1, N) * G
+    for coefficient in (1, 2, LAMBDA, N - 1, 2 ** 129 - 1, randint(1, N)):
+        assert coefficient * point == naive_rmul(coefficient, point)
+
+
+def test_dual_mul_matches_naive():
+    point = randint(1, N) * G
+    for _ in range(5):
+        u, v = randint(1, N), randint(1, N)
+        assert G.dual_mul(u, point, v) == naive_rmul(u, G) + naive_rmul(v, point)
+
+
+def test_precomputed_terms_match_terms():
+    table = jacobian.odd_multiples((randint(1, N) * G)._affine(), 5)
+    tables = glv.precompute(table)
+    for coefficient in (1, LAMBDA, N - 1, randint(1, N), randint(1, N)):
+        assert glv.precomputed_terms(coefficient, tables) == glv.terms(
+            coefficient, table
+        )
@@ -0,0 +1,104 @@
+from random import randint
+
+from littlebit.cryptography.point import Point
+from littlebit.cryptography.secp256k1 import jacobian
+from littlebit.cryptography.secp256k1.constants import Gx, Gy, N, P
+from littlebit.cryptography.secp256k1.point import (
+    S256Point,
+    generator_table,
+    multiply_generator,
+)
+
+G = S256Point(x=Gx, y=Gy)
+
+
+def naive_rmul(coefficient: int, point: S256Point) -> S256Point:
+    # Generic affine double-and-add, one field division per step
+    return Point.__rmul__(point, coefficient % N)
+
+
+def test_to_affine_roundtrip():
+    assert jacobian.to_affine(jacobian.to_jacobian((Gx, Gy))) == (Gx, Gy)
+    assert jacobian.to_affine(jacobian.INFINITY) is None
+
+
+def test_double_and_add():
+    g = jacobian.to_jacobian((Gx, Gy))
+    two_g = (2 * G)._affine()
+    three_g = (3 * G)._affine()
+
+    assert jacobian.to_affine(jacobian.double(g)) == two_g
+    assert jacobian.to_affine(jacobian.add(g, g)) == two_g
+    assert jacobian.to_affine(jacobian.add_affine(g, (Gx, Gy))) == two_g
+    assert jacobian.to_affine(jacobian.add(jacobian.double(g), g)) == three_g
+    assert jacobian.to_affine(jacobian.add_affine(jacobian.double(g), (Gx, Gy))) == (
+        three_g
+    )
+
+
+def test_add_inverse():
+    g = jacobian.to_jacobian((Gx, Gy))
+    minus_g = jacobian.to_jacobian((Gx, P - Gy))
+    assert jacobian.add(g, minus_g)[2] == 0
+    assert jacobian.add(jacobian.INFINITY, g) == g
+    assert jacobian.add(g, jacobian.INFINITY) == g
+
+
+def test_rmul_matches_naive():
+    for coefficient in (1, 2, 3, N - 1, randint(1, N), randint(1, 2 ** 128)):
+        assert coefficient * G == naive_rmul(coefficient, G)
+
+    point = randint(1, N) * G
+    for coefficient in (1, 7, N + 5, randint(1, N)):
+        assert coefficient * point == naive_rmul(coefficient, point)
+
+
+def test_rmul_identity():
+    assert (N * G).is_identity
+    assert (0 * G).is_identity
+
+
+def test_fixed_base_table():
+    table = generator_table()
+    assert len(table) == 64
+    assert all(len(row) == 15 for row in table)
+    assert table[0][0] == (Gx, Gy)
+    assert generator_table() is table  # built once, then cached
+
+    for coefficient in (1, 15, 16, 2 ** 255, N - 1, randint(1, N)):
+        expected = jacobian.to_affine(jacobian.multiply((Gx, Gy), coefficient))
+        assert jacobian.to_affine(multiply_generator(coefficient)) == expected
+
+
+def test_wnaf():
+    for width in (2, 5, 8):
+        for coefficient in (1, 2 ** 255, N - 1, randint(1, N)):
+            digits = jacobian.wnaf(coefficient, width)
+            assert sum(digit << i for i, digit in enumerate(digits)) == coefficient
+            assert all(
+                digit % 2 and abs(digit) < 2 ** (width - 1) for digit in digits if digit
+            )
+
+
+def test_dual_mul():
+    point = randint(1, N) * G
+    for u, v in ((1, 1), (0, 5), (5, 0), (N - 1, 1), (randint(1, N), randint(1, N))):
+        expected = naive_rmul(u, G) + naive_rmul(v, point)
+        assert G.dual_mul(u, point, v) == expected
+        assert point.dual_mul(v, G, u) == expected
+
+    assert G.dual_mul(1, G, N - 1).is_identity
+
+
+def test_to_affine_batch():
+    g = jacobian.to_jacobian((Gx, Gy))
+    points = [
+        jacobian.double(g),
+        jacobian.INFINITY,
+        g,
+        jacobian.add(jacobian.double(g), g),
+    ]
+    assert jacobian.to_affine_batch(points) == [
+        jacobian.to_affine(point) for point in points
+    ]
+    assert jacobian.to_affine_batch([]) == []
@@ -0,0 +1,37 @@
+from random import randint
+
+from littlebit.cryptography.secp256k1 import ladder, point
+from littlebit.cryptography.secp256k1.constants import Gx, Gy, N
+from littlebit.cryptography.secp256k1.point import G
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+def test_complete_add():
+    infinity = (0, 1, 0)
+    g = (Gx, Gy, 1)
+    two_g = ladder.complete_add(g, g)
+    assert ladder.to_affine(two_g) == (2 * G)._affine()
+    assert ladder.to_affine(ladder.complete_add(two_g, g)) == (3 * G)._affine()
+    assert ladder.to_affine(ladder.complete_add(g, infinity)) == (Gx, Gy)
+    assert ladder.to_affine(ladder.complete_add(infinity, infinity)) is None
+    assert ladder.to_affine(ladder.complete_add(g, (-1 * G)._affine() + (1,))) is None
+
+
+def test_ladder_mul():
+    other = randint(1, N) * G
+    for coefficient in (0, 1, 2, N - 1, N, 2 ** 255, randint(1, N)):
+        assert G.ladder_mul(coefficient) == coefficient * G
+        assert other.ladder_mul(coefficient) == coefficient * other
+
+
+def test_constant_time_mode():
+    private_key = PrivateKey(randint(1, N - 1))
+    z = randint(0, 2 ** 256)
+    expected = private_key.sign(z)
+
+    point.CONSTANT_TIME = True
+    try:
+        assert PrivateKey(private_key.secret).point == private_key.point
+        assert private_key.sign(z) == expected
+    finally:
+        point.CONSTANT_TIME = False
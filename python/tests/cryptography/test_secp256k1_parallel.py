@@ -0,0 +1,38 @@
+from random import randint
+
+import pytest
+
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.parallel import ParallelSigner, ParallelVerifier
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+def test_parallel_sign_and_verify():
+    secrets = [randint(1, N - 1) for _ in range(7)]
+    hashes = [randint(0, 2 ** 256 - 1) for _ in range(7)]
+    expected = [PrivateKey(s).sign(z).der() for s, z in zip(secrets, hashes)]
+
+    with ParallelSigner(max_workers=2, chunk_size=3) as signer:
+        signatures = signer.sign(
+            [
+                (s.to_bytes(32, "big"), z.to_bytes(32, "big"))
+                for s, z in zip(secrets, hashes)
+            ]
+        )
+    assert signatures == expected
+
+    items = [
+        (PrivateKey(s).point.sec(), der, z.to_bytes(32, "big"))
+        for s, der, z in zip(secrets, signatures, hashes)
+    ]
+    items[2] = (items[2][0], items[2][1], (hashes[2] ^ 1).to_bytes(32, "big"))
+    items[5] = (items[5][0], b"\x31" + items[5][1][1:], items[5][2])
+
+    with ParallelVerifier(max_workers=2, chunk_size=2) as verifier:
+        assert verifier.verify(items) == [True, True, False, True, True, False, True]
+        assert verifier.verify([]) == []
+
+
+def test_chunk_size():
+    with pytest.raises(ValueError):
+        ParallelVerifier(chunk_size=0)
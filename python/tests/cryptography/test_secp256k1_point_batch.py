@@ -0,0 +1,69 @@
+from random import randint
+
+import pytest
+
+from littlebit.cryptography.secp256k1 import verify_batch
+from littlebit.cryptography.secp256k1.constants import N
+from littlebit.cryptography.secp256k1.point import S256Point
+from littlebit.cryptography.secp256k1.point_batch import PointBatch
+from littlebit.cryptography.secp256k1.private_key import PrivateKey
+
+
+def random_keys(count):
+    return [PrivateKey(randint(1, N - 1)) for _ in range(count)]
+
+
+def test_point_batch_views_and_sec():
+    points = [key.point for key in random_keys(5)]
+    batch = PointBatch(points)
+
+    assert len(batch) == 5
+    assert [view.point() for view in batch] == points
+    assert batch[-1] == points[-1] and batch[0] != points[1]
+    assert (batch[2].x, batch[2].y) == (points[2].x.number, points[2].y.number)
+    assert batch.affine() == [point._affine() for point in points]
+
+    for compressed in (True, False):
+        assert batch[1].sec(compressed) == points[1].sec(compressed)
+        assert batch.sec(compressed) == b"".join(p.sec(compressed) for p in points)
+
+    assert batch[1:3] == PointBatch(points[1:3])
+    assert batch[::2] == PointBatch(points[::2])
+    with pytest.raises(IndexError):
+        batch[5]
+    with pytest.raises(ValueError):
+        batch.append(S256Point(x=None, y=None))
+
+
+def test_point_batch_parse():
+    points = [key.point for key in random_keys(6)]
+    # Mixed compressed and uncompressed encodings
+    blob = b"".join(point.sec(i % 2 == 0) for i, point in enumerate(points))
+
+    batch = PointBatch.parse(blob)
+    assert batch == PointBatch(points)
+    assert PointBatch.parse(memoryview(bytearray(blob))) == batch
+    assert PointBatch.parse(b"") == PointBatch()
+
+    with pytest.raises(ValueError):
+        PointBatch.parse(blob[:-1])
+    with pytest.raises(ValueError):
+        PointBatch.parse(b"\x05" + blob[1:])
+    uncompressed = points[0].sec(compressed=False)
+    with pytest.raises(ValueError):
+        PointBatch.parse(uncompressed[:-1] + bytes([uncompressed[-1] ^ 1]))
+
+
+def test_point_batch_verify():
+    keys = random_keys(4)
+    zs = [randint(0, 2 ** 256) for _ in keys]
+    signatures = [key.sign(z) for key, z in zip(keys, zs)]
+    batch = PointBatch(key.point for key in keys)
+
+    assert batch.verify(zs, signatures) == [True] * 4
+    zs[2] += 1
+    assert batch.verify(zs, signatures) == [True, True, False, True]
+    assert verify_batch(zip(batch, zs, signatures)) == [True, True, False, True]
+
+    with pytest.raises(ValueError):
+        batch.verify(zs[:3], signatures)
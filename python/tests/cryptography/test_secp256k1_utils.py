@@ -1,4 +1,13 @@
-from littlebit.cryptography.utils import encode_base58
+import pytest
+
+from littlebit.cryptography.utils import (
+    decode_base58,
+    decode_base58_checksum,
+    decode_many,
+    encode_base58,
+    encode_base58_checksum,
+    encode_many,
+)
 
 
 def test_base58():
@@ -20,3 +29,50 @@ def test_base58():
 
     for hex_string, base58 in cases:
         assert encode_base58(bytes.fromhex(hex_string)) == base58
+
+
+# Round trips, with the leading zero bytes which are encoded as leading 1s
+ROUND_TRIP_CASES = (
+    # hex, base58
+    (
+        "7c076ff316692a3d7eb3c3bb0f8b1488cf72e1afcd929e29307032997a838a3d",
+        "9MA8fRQrT4u8Zj8ZRd6MAiiyaxb2Y1CMpvVkHQu5hVM6",
+    ),
+    ("", ""),
+    ("00", "1"),
+    ("0000ff", "115Q"),
+    (
+        "00010966776006953d5567439e5e39f86a0d273beed61967f6",
+        "16UwLL9Risc3QfPqBUvKofHmBQ7wMtjvM",
+    ),
+)
+
+
+def test_decode_base58():
+    for hex_string, base58 in ROUND_TRIP_CASES:
+        assert decode_base58(base58) == bytes.fromhex(hex_string)
+
+    with pytest.raises(ValueError):
+        decode_base58("0OIl")
+
+
+def test_base58_checksum():
+    address = "16UwLL9Risc3QfPqBUvKofHmBQ7wMtjvM"
+    payload = decode_base58_checksum(address)
+    assert payload.hex() == "00010966776006953d5567439e5e39f86a0d273bee"
+    assert encode_base58_checksum(payload) == address
+
+    for hex_string in ("", "00", "0000ff"):
+        payload = bytes.fromhex(hex_string)
+        assert decode_base58_checksum(encode_base58_checksum(payload)) == payload
+
+    with pytest.raises(ValueError):
+        decode_base58_checksum("16UwLL9Risc3QfPqBUvKofHmBQ7wMtjvN")
+
+
+def test_many():
+    bytestrings = [bytes.fromhex(hex_string) for hex_string, _ in ROUND_TRIP_CASES]
+    strings = [base58 for _, base58 in ROUND_TRIP_CASES]
+    assert encode_many(bytestrings) == strings
+    assert decode_many(strings) == bytestrings
+    assert decode_many(encode_many(bytestrings, True), True) == bytestrings
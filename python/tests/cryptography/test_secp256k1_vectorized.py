@@ -0,0 +1,109 @@
+import sys
+from random import randint
+
+import pytest
+
+from littlebit.cryptography.secp256k1 import backend, jacobian
+from littlebit.cryptography.secp256k1.constants import Gx, Gy, N, P
+from littlebit.cryptography.secp256k1.derive import derive_addresses
+from littlebit.cryptography.secp256k1.field import S256FieldElement
+from littlebit.cryptography.secp256k1.point import multiply_generator
+
+
+@pytest.fixture
+def vectorized():
+    pytest.importorskip("numpy")
+    from littlebit.cryptography.secp256k1 import vectorized
+
+    return vectorized
+
+
+@pytest.fixture
+def numpy_backend():
+    pytest.importorskip("numpy")
+    backend.set_backend("numpy")
+    yield
+    backend.set_backend("python")
+
+
+def random_points(count):
+    return [multiply_generator(randint(1, N - 1)) for _ in range(count)]
+
+
+def test_field_arithmetic(vectorized):
+    a = [0, 1, P - 1, P - 1] + [randint(0, P - 1) for _ in range(50)]
+    b = [0, P - 1, 1, P - 1] + [randint(0, P - 1) for _ in range(50)]
+    x, y = vectorized.from_ints(a), vectorized.from_ints(b)
+    elements = list(zip(map(S256FieldElement, a), map(S256FieldElement, b)))
+
+    assert vectorized.to_ints(x) == a
+    assert vectorized.to_ints(vectorized.add(x, y)) == [
+        (e + f).number for e, f in elements
+    ]
+    assert vectorized.to_ints(vectorized.sub(x, y)) == [
+        (e - f).number for e, f in elements
+    ]
+    assert vectorized.to_ints(vectorized.mul(x, y)) == [
+        (e * f).number for e, f in elements
+    ]
+    assert vectorized.to_ints(vectorized.square(x)) == [
+        (e ** 2).number for e, _ in elements
+    ]
+    assert list(vectorized.is_zero(vectorized.sub(x, x))) == [True] * len(a)
+    assert list(vectorized.is_zero(x)[:3]) == [True, False, False]
+
+
+def test_point_arithmetic(vectorized):
+    p, q = random_points(20), random_points(20)
+    # Special cases: P + P, P + (-P), I + Q and P + I
+    p += [p[0], p[1], jacobian.INFINITY, p[2]]
+    q += [p[0], (p[1][0], P - p[1][1], p[1][2]), q[0], jacobian.INFINITY]
+
+    def affine(points):
+        return jacobian.to_affine_batch(points)
+
+    vp, vq = vectorized.from_points(p), vectorized.from_points(q)
+    assert affine(vectorized.to_points(vectorized.double(vp))) == affine(
+        [jacobian.double(point) for point in p]
+    )
+    assert affine(vectorized.to_points(vectorized.add_points(vp, vq))) == affine(
+        [jacobian.add(a, b) for a, b in zip(p, q)]
+    )
+
+    q_affine = [jacobian.to_affine(point) or (Gx, Gy) for point in q]
+    x2 = vectorized.from_ints([x for x, _ in q_affine])
+    y2 = vectorized.from_ints([y for _, y in q_affine])
+    assert affine(vectorized.to_points(vectorized.add_affine(vp, (x2, y2)))) == affine(
+        [jacobian.add_affine(a, b) for a, b in zip(p, q_affine)]
+    )
+
+
+def test_multiply_generator(vectorized):
+    scalars = [1, 2, N - 1, N, 2 ** 255] + [randint(1, N - 1) for _ in range(20)]
+    assert jacobian.to_affine_batch(
+        vectorized.multiply_generator(scalars)
+    ) == jacobian.to_affine_batch([multiply_generator(k) for k in scalars])
+
+
+def test_derive_addresses_numpy_backend(numpy_backend):
+    start = randint(1, N - 100)
+    secrets = [1, 5, N - 1] + list(range(start, start + 5)) + [randint(1, N - 1)]
+
+    derived = list(derive_addresses(secrets, chunk_size=4))
+    backend.set_backend("python")
+    assert derived == list(derive_addresses(secrets, chunk_size=4))
+
+
+def test_backend_selection(monkeypatch):
+    assert backend.get_backend() == "python"
+    with pytest.raises(ValueError):
+        backend.set_backend("fortran")
+
+    # Simulate a missing NumPy
+    monkeypatch.setitem(sys.modules, "numpy", None)
+    assert backend.available_backends() == ["python"]
+    with pytest.raises(ImportError):
+        backend.set_backend("numpy")
+
+    backend.set_backend("auto")
+    assert backend.get_backend() == "python"